@@ -1,3 +1,10 @@
+import time
+
+from algorithms.dsatur import dsatur_colors
+from functions.analysis import get_greedy_clique
+from functions.conflict_graph import as_conflict_graph
+
+
 def backtracking_coloring(adjazenz):
     vertices = list(adjazenz.keys())
     n = len(vertices)
@@ -6,26 +13,9 @@ def backtracking_coloring(adjazenz):
     order = {v: i for i, v in enumerate(vertices)}
     deg = {v: len(adjazenz[v]) for v in vertices}
 
-    def greedy_dsatur_upper_bound():
-        uncolored = set(vertices)
-        color = {}
-        nbr_colors = {v: set() for v in vertices}
-        sat = {v: 0 for v in vertices}
-        while uncolored:
-            v = max(uncolored, key=lambda x: (sat[x], deg[x], -order[x]))
-            c = 0
-            while c in nbr_colors[v]:
-                c += 1
-            color[v] = c
-            uncolored.remove(v)
-            for u in adjazenz[v]:
-                if u in uncolored and c not in nbr_colors[u]:
-                    nbr_colors[u].add(c)
-                    sat[u] += 1
-        return 1 + max(color.values()) if color else 0
-
-    best_assign = None
-    best_k = greedy_dsatur_upper_bound() or 1
+    graph = as_conflict_graph(adjazenz)
+    best_assign = graph.coloring_from_indices(dsatur_colors(graph))
+    best_k = (1 + max(best_assign.values())) if best_assign else 1
     assigned = {}
     used_colors = 0
     nbr_colors = {v: set() for v in vertices}
@@ -89,4 +79,119 @@ def backtracking_coloring(adjazenz):
         uncolored.add(v)
 
     dfs()
-    return best_assign if best_assign is not None else {}
\ No newline at end of file
+    return best_assign
+
+
+def branch_and_bound_coloring(adjazenz, time_limit=None, node_limit=None, bitset=None):
+    """
+    Exakte Färbung (DSATUR-Branch-and-Bound) ohne Rekursion.
+
+    - obere Schranke: DSATUR-Färbung, untere Schranke: gierig gefundene Clique
+    - die Clique wird vorab mit 0..q-1 gefärbt (Symmetriebrechung)
+    - Abbruch, sobald obere = untere Schranke, oder wenn das Budget
+      (time_limit in Sekunden, node_limit = Anzahl Suchknoten) erschöpft ist
+    - bitset: für die DSATUR-Schranke (Standard: automatisch ab analysis.BITSET_DENSITY)
+
+    -> Dictionary mit der besten gefundenen Färbung und dem Beweisstatus
+       (bei abgeschlossener Suche ist lower_bound = k)
+    """
+    t_start = time.perf_counter()
+    graph = as_conflict_graph(adjazenz)
+    n = len(graph.nodes)
+    nbrs = graph.nbrs
+    deg = [len(nb) for nb in nbrs]
+
+    best = dsatur_colors(graph, bitset=bitset)
+    best_k = 1 + max(best) if n else 0
+    clique = [graph.index[v] for v in get_greedy_clique(graph)]
+    lower_bound = len(clique)
+
+    color = [-1] * n
+    # Farben der gefärbten Nachbarn je Knoten als Bitmaske (Bit c gesetzt = Farbe c verboten)
+    nbr_colors = [0] * n
+    uncolored = set(range(n))
+
+    def apply(v, c):
+        color[v] = c
+        uncolored.discard(v)
+        cbit = 1 << c
+        changed = []
+        for u in nbrs[v]:
+            if color[u] < 0 and not nbr_colors[u] & cbit:
+                nbr_colors[u] |= cbit
+                changed.append(u)
+        return changed
+
+    for c, v in enumerate(clique):
+        apply(v, c)
+    used_colors = len(clique)
+
+    def select_vertex():
+        return max(uncolored, key=lambda x: (nbr_colors[x].bit_count(), deg[x], -x))
+
+    nodes = 0
+    exhausted = True
+    # Stack-Eintrag: [Knoten, nächste zu probierende Farbe, geänderte Nachbarn, neue Farbe eröffnet]
+    stack = []
+    if best_k > lower_bound and uncolored:
+        v = select_vertex()
+        uncolored.discard(v)
+        stack.append([v, 0, None, False])
+
+    while stack:
+        frame = stack[-1]
+        v = frame[0]
+        if frame[2] is not None:
+            keep = ~(1 << color[v])
+            for u in frame[2]:
+                nbr_colors[u] &= keep
+            color[v] = -1
+            frame[2] = None
+            if frame[3]:
+                used_colors -= 1
+                frame[3] = False
+
+        c = frame[1]
+        limit = min(used_colors + 1, best_k - 1)
+        while c < limit and c < used_colors and nbr_colors[v] >> c & 1:
+            c += 1
+        if c >= limit:
+            stack.pop()
+            uncolored.add(v)
+            continue
+
+        frame[1] = c + 1
+        frame[2] = apply(v, c)
+        if c == used_colors:
+            used_colors += 1
+            frame[3] = True
+
+        nodes += 1
+        if (node_limit is not None and nodes >= node_limit) or \
+                (time_limit is not None and time.perf_counter() - t_start >= time_limit):
+            exhausted = False
+            break
+
+        if not uncolored:
+            best = color.copy()
+            best_k = used_colors
+            if best_k <= lower_bound:
+                break
+            continue
+
+        u = select_vertex()
+        uncolored.discard(u)
+        stack.append([u, 0, None, False])
+
+    #### vollständig durchsucht: die beste Färbung ist selbst die untere Schranke
+    if exhausted:
+        lower_bound = best_k
+    return {
+        "coloring": graph.coloring_from_indices(best),
+        "k": best_k,
+        "lower_bound": lower_bound,
+        "proven_optimal": exhausted or best_k <= lower_bound,
+        "gap": best_k - lower_bound,
+        "nodes": nodes,
+        "elapsed": time.perf_counter() - t_start,
+    }
@@ -0,0 +1,127 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from algorithms.backtracking import branch_and_bound_coloring
+from functions.conflict_graph import as_conflict_graph
+
+#### Prozesspool erst ab so vielen Knoten außerhalb der größten Komponente (sonst überwiegt der Start des Pools)
+PARALLEL_MIN_NODES = 2000
+
+
+def get_components(adjazenz):
+    graph = as_conflict_graph(adjazenz)
+    nbrs = graph.nbrs
+    seen = [False] * len(nbrs)
+    components = []
+    for s in range(len(nbrs)):
+        if seen[s]:
+            continue
+        seen[s] = True
+        comp = [s]
+        stack = [s]
+        while stack:
+            v = stack.pop()
+            for u in nbrs[v]:
+                if not seen[u]:
+                    seen[u] = True
+                    comp.append(u)
+                    stack.append(u)
+        comp.sort()
+        components.append(comp)
+    return graph, components
+
+
+def split_components(adjazenz):
+    """Zerlegt den Graphen in Zusammenhangskomponenten -> Liste von ConflictGraph-Teilgraphen."""
+    graph, components = get_components(adjazenz)
+    if len(components) == 1:
+        return [graph]
+    return [graph.subgraph(comp) for comp in components]
+
+
+def _pool_size(parts, processes):
+    """Anzahl Prozesse für parts; None = sequentiell (ein Prozess oder zu wenig parallelisierbare Arbeit)."""
+    if processes == 0:
+        processes = os.cpu_count()
+    if processes is None or processes <= 1 or len(parts) <= 1:
+        return None
+    sizes = sorted(len(part) for part in parts)
+    if sum(sizes[:-1]) < PARALLEL_MIN_NODES:
+        return None
+    return min(processes, len(parts))
+
+
+def _map(fn, items, processes):
+    if processes is None or processes <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    chunksize = max(1, len(items) // (processes * 4))
+    with ProcessPoolExecutor(max_workers=processes) as ex:
+        return list(ex.map(fn, items, chunksize=chunksize))
+
+
+def _renumber(coloring):
+    mapping = {c: i for i, c in enumerate(sorted(set(coloring.values())))}
+    return {v: mapping[c] for v, c in coloring.items()}
+
+
+def color_by_components(adjazenz, algorithm, processes=None):
+    """
+    Färbt jede Zusammenhangskomponente einzeln mit algorithm (z.B. dsatur_heap)
+    und führt die Ergebnisse zusammen. Die Farben jeder Komponente werden ab 0
+    durchnummeriert, die Komponenten teilen sich also dieselben Farben.
+
+    - processes: Anzahl Prozesse (None/1 = sequentiell, 0 = alle CPU-Kerne); kleine Graphen bzw. eine
+      große Komponente mit wenigen Kleinteilen werden immer sequentiell gefärbt (siehe PARALLEL_MIN_NODES)
+    """
+    graph = as_conflict_graph(adjazenz)
+    parts = split_components(graph)
+
+    merged = {}
+    for coloring in _map(algorithm, parts, _pool_size(parts, processes)):
+        merged.update(_renumber(coloring))
+    return {v: merged[v] for v in graph.nodes}
+
+
+def _branch_and_bound_until(adjazenz, deadline, node_limit):
+    remaining = None if deadline is None else max(0.0, deadline - time.time())
+    return branch_and_bound_coloring(adjazenz, time_limit=remaining, node_limit=node_limit)
+
+
+def branch_and_bound_by_components(adjazenz, time_limit=None, node_limit=None, processes=None):
+    """
+    Exakte Färbung je Komponente (branch_and_bound_coloring).
+    Das Zeitbudget gilt für den gesamten Aufruf, jede Komponente erhält die verbleibende Restzeit.
+    processes wie bei color_by_components.
+
+    -> Dictionary wie bei branch_and_bound_coloring; bei bewiesener Optimalität ist lower_bound = k
+    """
+    t_start = time.perf_counter()
+    graph = as_conflict_graph(adjazenz)
+    parts = split_components(graph)
+
+    deadline = None if time_limit is None else time.time() + time_limit
+    results = _map(partial(_branch_and_bound_until, deadline=deadline, node_limit=node_limit), parts,
+                   _pool_size(parts, processes))
+
+    merged = {}
+    for r in results:
+        merged.update(_renumber(r["coloring"]))
+
+    k = max((r["k"] for r in results), default=0)
+    lower_bound = max((r["lower_bound"] for r in results), default=0)
+    proven = k <= lower_bound or any(r["proven_optimal"] and r["k"] == k for r in results)
+    #### die Schranke ist das Maximum über die Komponenten; eine bewiesene Komponente mit k Farben hebt sie auf k
+    if proven:
+        lower_bound = k
+    return {
+        "coloring": {v: merged[v] for v in graph.nodes},
+        "k": k,
+        "lower_bound": lower_bound,
+        "proven_optimal": proven,
+        "gap": k - lower_bound,
+        "nodes": sum(r["nodes"] for r in results),
+        "elapsed": time.perf_counter() - t_start,
+        "components": len(parts),
+    }
@@ -1,3 +1,9 @@
+import heapq
+
+from functions.analysis import use_bitset
+from functions.conflict_graph import as_conflict_graph
+
+
 def dsatur(adjazenz):
 
     V = list(adjazenz.keys())
@@ -35,4 +41,75 @@ def dsatur(adjazenz):
                 highest_color = color
         return highest_color
 
-    return color
\ No newline at end of file
+    return color
+
+def dsatur_colors(graph, bitset=None):
+    if bitset is None:
+        bitset = use_bitset(graph)
+    if bitset:
+        return _dsatur_colors_bitset(graph)
+
+    n = len(graph.nodes)
+    nbrs = graph.nbrs
+    deg = [len(nb) for nb in nbrs]
+
+    color = [-1] * n
+    nbr_colors = [set() for _ in range(n)]
+    sat = [0] * n
+
+    heap = [(0, -deg[i], i) for i in range(n)]
+    heapq.heapify(heap)
+
+    while heap:
+        neg_sat, _, v = heapq.heappop(heap)
+        if color[v] >= 0 or -neg_sat != sat[v]:
+            continue
+
+        forbidden = nbr_colors[v]
+        c = 0
+        while c in forbidden:
+            c += 1
+        color[v] = c
+
+        for u in nbrs[v]:
+            if color[u] < 0 and c not in nbr_colors[u]:
+                nbr_colors[u].add(c)
+                sat[u] += 1
+                heapq.heappush(heap, (-sat[u], -deg[u], u))
+
+    return color
+
+
+def _dsatur_colors_bitset(graph):
+    # wie dsatur_colors, aber verbotene Farben je Knoten als Bitmaske statt als set
+    n = len(graph.nodes)
+    nbrs = graph.nbrs
+    deg = [len(nb) for nb in nbrs]
+
+    color = [-1] * n
+    forbidden = [0] * n
+
+    heap = [(0, -deg[i], i) for i in range(n)]
+    heapq.heapify(heap)
+
+    while heap:
+        neg_sat, _, v = heapq.heappop(heap)
+        if color[v] >= 0 or -neg_sat != forbidden[v].bit_count():
+            continue
+
+        f = forbidden[v]
+        c = (~f & (f + 1)).bit_length() - 1
+        color[v] = c
+
+        cbit = 1 << c
+        for u in nbrs[v]:
+            if color[u] < 0 and not forbidden[u] & cbit:
+                forbidden[u] |= cbit
+                heapq.heappush(heap, (-forbidden[u].bit_count(), -deg[u], u))
+
+    return color
+
+
+def dsatur_heap(adjazenz, bitset=None):
+    graph = as_conflict_graph(adjazenz)
+    return graph.coloring_from_indices(dsatur_colors(graph, bitset=bitset))
@@ -0,0 +1,101 @@
+import random
+
+import numpy as np
+
+from functions.conflict_graph import as_conflict_graph
+
+#### ab diesem mittleren Grad lohnt sich das Markieren der verbotenen Farben per numpy-Indexzugriff
+VECTOR_DEGREE = 32
+
+
+##############################################################################################
+#### Reihenfolgen (-> Liste von Knotennummern)
+def order_shuffled(graph, seed=None):
+    """Zufällige Reihenfolge, gleiche Zufallsfolge wie greedy_algorithm(adjazenz, seed=seed)."""
+    order = list(range(len(graph)))
+    if seed is None:
+        random.shuffle(order)
+    else:
+        random.Random(seed).shuffle(order)
+    return order
+
+
+def order_degree(graph, seed=None):
+    """Absteigender Grad, bei Gleichstand Knotenreihenfolge (wie welsh_powell_algorithm)."""
+    deg = [len(nb) for nb in graph.nbrs]
+    return sorted(range(len(deg)), key=deg.__getitem__, reverse=True)
+
+
+def order_smallest_last(graph, seed=None):
+    """Smallest-Last (Degeneriertheits-Reihenfolge), siehe algorithms/smallest_last.py."""
+    from algorithms.smallest_last import degeneracy_ordering
+
+    return degeneracy_ordering(graph)[0]
+
+
+ORDERINGS = {
+    "shuffled": order_shuffled,
+    "degree": order_degree,
+    "smallest_last": order_smallest_last,
+}
+
+
+##############################################################################################
+#### First-Fit über CSR
+def _first_fit_lists(indptr, indices, order, max_degree):
+    color = [-1] * (len(indptr) - 1)
+    #### mark[c] == v: Farbe c ist für v verboten; mark[-1] nimmt die ungefärbten Nachbarn auf
+    mark = [-1] * (max_degree + 2)
+    for v in order:
+        for u in indices[indptr[v]:indptr[v + 1]]:
+            mark[color[u]] = v
+        c = 0
+        while mark[c] == v:
+            c += 1
+        color[v] = c
+    return color
+
+
+def _first_fit_numpy(indptr, indices, order, max_degree):
+    color = np.full(len(indptr) - 1, -1, dtype=np.int64)
+    mark = np.full(max_degree + 2, -1, dtype=np.int64)
+    for v in order:
+        mark[color[indices[indptr[v]:indptr[v + 1]]]] = v
+        c = 0
+        while mark[c] == v:
+            c += 1
+        color[v] = c
+    return color.tolist()
+
+
+def first_fit_colors(graph, order):
+    """
+    Kleinste freie Farbe in der gegebenen Reihenfolge, ohne Mengen je Knoten: Farben stehen in
+    einem Array, verbotene Farben werden in einem wiederverwendeten Stempel-Array mit der
+    Nummer des aktuellen Knotens markiert.
+
+    -> Farbliste (Index = Knotennummer)
+    """
+    indptr, indices = graph.to_csr()
+    n = len(indptr) - 1
+    if n == 0:
+        return []
+    max_degree = int(np.diff(indptr).max())
+    if indptr[-1] >= VECTOR_DEGREE * n:
+        return _first_fit_numpy(indptr, indices, order, max_degree)
+    indptr_l, indices_l = graph.cached("csr_lists", lambda g: (indptr.tolist(), indices.tolist()))
+    return _first_fit_lists(indptr_l, indices_l, order, max_degree)
+
+
+def first_fit(adjazenz, order="degree", seed=None):
+    """
+    Greedy-Färbung (First-Fit) mit austauschbarer Reihenfolge.
+
+    - order: Name aus ORDERINGS ("shuffled", "degree", "smallest_last") oder Funktion (graph, seed) -> Knotennummern
+    - seed: nur für zufällige Reihenfolgen
+
+    Gleiche Färbung wie greedy_algorithm (order="shuffled") bzw. welsh_powell_algorithm (order="degree").
+    """
+    graph = as_conflict_graph(adjazenz)
+    ordering = ORDERINGS[order] if isinstance(order, str) else order
+    return graph.coloring_from_indices(first_fit_colors(graph, ordering(graph, seed)))
@@ -1,8 +1,18 @@
+import os
 import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
-def greedy_algorithm(adjazenz):
+from algorithms.components import PARALLEL_MIN_NODES
+from algorithms.first_fit import first_fit_colors, order_shuffled
+from functions.conflict_graph import as_conflict_graph
+
+def greedy_algorithm(adjazenz, seed=None):
     U = list(adjazenz.keys())
-    random.shuffle(U)
+    if seed is None:
+        random.shuffle(U)
+    else:
+        random.Random(seed).shuffle(U)
     vertices_colors = {}
     for vertice in U:
         neighbors = set()
@@ -31,4 +41,67 @@ def greedy_algorithm(adjazenz):
                 highest_color = color
         return highest_color
 
-    return vertices_colors
\ No newline at end of file
+    return vertices_colors
+
+
+##############################################################################################
+#### Mehrfachstart: viele zufällige Reihenfolgen, beste Färbung behalten
+_worker_graph = None
+
+
+def _init_worker(graph):
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _greedy_run(seed, graph=None):
+    # gleiche Reihenfolge wie greedy_algorithm(adjazenz, seed=seed), aber über Knotennummern
+    graph = _worker_graph if graph is None else graph
+    return seed, first_fit_colors(graph, order_shuffled(graph, seed))
+
+
+def greedy_multistart(adjazenz, restarts=32, seed=0, processes=None, score=None):
+    """
+    Führt den Greedy-Algorithmus mit restarts zufälligen Reihenfolgen aus (reproduzierbar über seed)
+    und behält die Färbung mit den wenigsten Farben. Bei Gleichstand entscheidet score(Färbung)
+    (größer = besser, z.B. Soft-Constraint-Score aus create_timetable), sonst der erste Lauf.
+
+    - processes: Anzahl Prozesse (None/1 = sequentiell, 0 = alle CPU-Kerne); Graphen unter
+      PARALLEL_MIN_NODES Knoten werden immer sequentiell gefärbt (sonst überwiegt der Start des Pools)
+
+    -> Dictionary mit Färbung, Farbanzahl, Seed des besten Laufs und Verteilung der Farbanzahlen
+    """
+    if processes == 0:
+        processes = os.cpu_count()
+    graph = as_conflict_graph(adjazenz)
+    rng = random.Random(seed)
+    seeds = [rng.getrandbits(64) for _ in range(restarts)]
+
+    if processes is not None and processes > 1 and restarts > 1 and len(graph) >= PARALLEL_MIN_NODES:
+        processes = min(processes, restarts)
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                                 initargs=(graph,)) as ex:
+            runs = list(ex.map(_greedy_run, seeds, chunksize=max(1, restarts // (processes * 4))))
+    else:
+        runs = [_greedy_run(s, graph) for s in seeds]
+
+    counts = [1 + max(colors) if colors else 0 for _, colors in runs]
+    best_k = min(counts)
+    candidates = [run for run, k in zip(runs, counts) if k == best_k]
+
+    best_seed, best_colors = candidates[0]
+    best_score = None
+    if score is not None:
+        for run_seed, colors in candidates:
+            s = score(graph.coloring_from_indices(colors))
+            if best_score is None or s > best_score:
+                best_seed, best_colors, best_score = run_seed, colors, s
+
+    return {
+        "coloring": graph.coloring_from_indices(best_colors),
+        "k": best_k,
+        "seed": best_seed,
+        "score": best_score,
+        "restarts": restarts,
+        "distribution": dict(sorted(Counter(counts).items())),
+    }
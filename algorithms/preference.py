@@ -0,0 +1,111 @@
+import heapq
+
+from algorithms.first_fit import ORDERINGS
+from functions.conflict_graph import as_conflict_graph
+
+
+##############################################################################################
+#### Farbwahl mit Präferenz-Tendenz je Farbklasse
+def _pick(forbidden, k, agree, size, p):
+    """
+    Unter den vorhandenen freien Farben 0..k-1 die Klasse mit der besten Tendenz zu Präferenz p:
+    Kurse mit gleicher Präferenz minus Kurse mit anderer. Ohne Präferenz (p < 0) oder bei Gleichstand
+    die kleinste freie Farbe; ist keine frei, wird Farbe k eröffnet.
+    """
+    best, best_score = k, None
+    for c in range(k):
+        if c in forbidden:
+            continue
+        if p < 0:
+            return c
+        score = 2 * agree[c].get(p, 0) - size[c]
+        if best_score is None or score > best_score:
+            best, best_score = c, score
+    return best
+
+
+def _assign(c, p, k, agree, size):
+    if c == k:
+        agree.append({})
+        size.append(0)
+        k += 1
+    size[c] += 1
+    if p >= 0:
+        agree[c][p] = agree[c].get(p, 0) + 1
+    return k
+
+
+def preference_dsatur_colors(graph, pref):
+    """DSATUR (Reihenfolge wie dsatur_colors), Farbwahl über _pick. pref: Präferenz-Nummer je Knoten, -1 = keine."""
+    n = len(graph.nodes)
+    nbrs = graph.nbrs
+    deg = [len(nb) for nb in nbrs]
+
+    color = [-1] * n
+    nbr_colors = [set() for _ in range(n)]
+    sat = [0] * n
+    k, agree, size = 0, [], []
+
+    heap = [(0, -deg[i], i) for i in range(n)]
+    heapq.heapify(heap)
+
+    while heap:
+        neg_sat, _, v = heapq.heappop(heap)
+        if color[v] >= 0 or -neg_sat != sat[v]:
+            continue
+
+        c = _pick(nbr_colors[v], k, agree, size, pref[v])
+        k = _assign(c, pref[v], k, agree, size)
+        color[v] = c
+
+        for u in nbrs[v]:
+            if color[u] < 0 and c not in nbr_colors[u]:
+                nbr_colors[u].add(c)
+                sat[u] += 1
+                heapq.heappush(heap, (-sat[u], -deg[u], u))
+
+    return color
+
+
+def preference_first_fit_colors(graph, order, pref):
+    """Greedy in fester Reihenfolge, Farbwahl über _pick."""
+    nbrs = graph.nbrs
+    color = [-1] * len(nbrs)
+    k, agree, size = 0, [], []
+    for v in order:
+        forbidden = {color[u] for u in nbrs[v]}
+        c = _pick(forbidden, k, agree, size, pref[v])
+        k = _assign(c, pref[v], k, agree, size)
+        color[v] = c
+    return color
+
+
+def preference_coloring(adjazenz, preferred, order=None, seed=None):
+    """
+    Färbung, die Präferenzen (z.B. Morning/Afternoon) schon bei der Farbwahl berücksichtigt:
+    jede Farbklasse führt Buch, wie viele ihrer Kurse welche Präferenz haben, und ein Kurs wählt unter
+    den bereits vorhandenen freien Farben die Klasse, die am stärksten zu seiner Präferenz tendiert.
+    Neue Farben werden nur eröffnet, wenn keine vorhandene frei ist. So entstehen möglichst
+    einheitliche Klassen, die create_timetable vollständig auf passende Slots legen kann.
+
+    - preferred: {Knoten: Präferenz}, fehlende/NaN = keine Präferenz
+    - order: None = DSATUR, sonst Name aus ORDERINGS ("shuffled", "degree", "smallest_last") oder Funktion
+
+    -> {Knoten: Farbe}
+    """
+    graph = as_conflict_graph(adjazenz)
+    ids = {}
+    pref = []
+    for node in graph.nodes:
+        value = preferred.get(node)
+        if value is None or value != value:
+            pref.append(-1)
+        else:
+            pref.append(ids.setdefault(value, len(ids)))
+
+    if order is None:
+        color = preference_dsatur_colors(graph, pref)
+    else:
+        ordering = ORDERINGS[order] if isinstance(order, str) else order
+        color = preference_first_fit_colors(graph, ordering(graph, seed), pref)
+    return graph.coloring_from_indices(color)
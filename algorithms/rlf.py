@@ -1,3 +1,9 @@
+import heapq
+
+from functions.analysis import use_bitset
+from functions.conflict_graph import as_conflict_graph, iter_bits
+
+
 def rlf_algorithm(adjazenz):
     adjazenz = {v: (set(nbs) if not isinstance(nbs, set) else nbs)
                 for v, nbs in adjazenz.items()}
@@ -51,4 +57,134 @@ def rlf_algorithm(adjazenz):
                 highest_color = color
         return highest_color
 
-    return color
\ No newline at end of file
+    return color
+
+
+def rlf_incremental(adjazenz, bitset=None):
+    graph = as_conflict_graph(adjazenz)
+    if bitset is None:
+        bitset = use_bitset(graph)
+    if bitset:
+        return _rlf_bitset(graph)
+    nodes = graph.nodes
+    index = graph.index
+    nbrs = graph.nbrs
+    n = len(nodes)
+
+    rank = [0] * n
+    for r, i in enumerate(sorted(range(n), key=lambda i: nodes[i])):
+        rank[i] = r
+
+    # Zustand je Knoten: nicht mehr in U, möglich (U - W - F), in F, in W
+    OUT, POSSIBLE, FORBIDDEN, CHOSEN = 0, 1, 2, 3
+    state = [POSSIBLE] * n
+    deg_u = [len(nb) for nb in nbrs]
+    cnt_f = [0] * n
+    cnt_p = [0] * n
+    W = []
+    changed = set()
+
+    def to_forbidden(f):
+        state[f] = FORBIDDEN
+        for y in nbrs[f]:
+            if state[y] != OUT:
+                cnt_p[y] -= 1
+                cnt_f[y] += 1
+                changed.add(y)
+
+    def to_chosen(x):
+        state[x] = CHOSEN
+        W.append(x)
+        for y in nbrs[x]:
+            if state[y] != OUT:
+                cnt_p[y] -= 1
+        for y in nbrs[x]:
+            if state[y] == POSSIBLE:
+                to_forbidden(y)
+
+    U = set(nodes)
+    current_color = 0
+    color = {}
+
+    while len(U) > 0:
+        members = [index[v] for v in U]
+        for v in members:
+            state[v] = POSSIBLE
+            cnt_f[v] = 0
+            cnt_p[v] = deg_u[v]
+        W.clear()
+
+        start = max(U, key=lambda k: deg_u[index[k]])
+        to_chosen(index[start])
+        changed.clear()
+
+        heap = [(-cnt_f[v], -cnt_p[v], rank[v], v) for v in members if state[v] == POSSIBLE]
+        heapq.heapify(heap)
+
+        while heap:
+            neg_f, neg_p, _, v = heapq.heappop(heap)
+            if state[v] != POSSIBLE or -neg_f != cnt_f[v] or -neg_p != cnt_p[v]:
+                continue
+            to_chosen(v)
+            for y in changed:
+                if state[y] == POSSIBLE:
+                    heapq.heappush(heap, (-cnt_f[y], -cnt_p[y], rank[y], y))
+            changed.clear()
+
+        for v in members:
+            state[v] = OUT
+        for x in W:
+            color[nodes[x]] = current_color
+            for y in nbrs[x]:
+                deg_u[y] -= 1
+        current_color = current_color + 1
+        U = U - {nodes[x] for x in W}
+
+    return color
+
+
+def _rlf_bitset(graph):
+    # RLF wie im Original, die Mengen U, W, F und U - W - F sind aber Bitmasken
+    nodes = graph.nodes
+    index = graph.index
+    bits = graph.to_bitsets()
+    n = len(nodes)
+
+    rank = [0] * n
+    for r, i in enumerate(sorted(range(n), key=lambda i: nodes[i])):
+        rank[i] = r
+
+    U = set(nodes)
+    in_u = (1 << n) - 1
+    current_color = 0
+    color = {}
+
+    while len(U) > 0:
+        start = max(U, key=lambda k: (bits[index[k]] & in_u).bit_count())
+        s = index[start]
+        W = 1 << s
+        F = bits[s] & in_u
+        possible = in_u & ~F & ~W
+
+        while possible:
+            optimal = -1
+            best = None
+            for v in iter_bits(possible):
+                nb = bits[v]
+                key = ((nb & F).bit_count(), (nb & possible).bit_count(), -rank[v])
+                if best is None or key > best:
+                    best = key
+                    optimal = v
+            W |= 1 << optimal
+            F |= bits[optimal] & in_u
+            possible &= ~bits[optimal]
+            possible ^= 1 << optimal
+
+        members = list(iter_bits(W))
+        for x in members:
+            color[nodes[x]] = current_color
+        current_color = current_color + 1
+        in_u &= ~W
+        U = U - {nodes[x] for x in members}
+
+    return color
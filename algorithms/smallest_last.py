@@ -0,0 +1,77 @@
+from algorithms.first_fit import first_fit_colors
+from functions.conflict_graph import as_conflict_graph
+
+
+def _degeneracy_ordering(graph):
+    """
+    Entfernt wiederholt einen Knoten mit kleinstem Restgrad (Matula/Beck) in O(V + E):
+    die Knoten liegen nach Restgrad sortiert in vert, start[d] zeigt auf den ersten Knoten mit
+    Restgrad d. Sinkt der Grad eines Nachbarn, wird er mit dem ersten Knoten seines Eimers
+    getauscht und der Eimer um eins verkleinert.
+
+    -> (Entfernungsreihenfolge, Degeneriertheit)
+    """
+    nbrs = graph.nbrs
+    n = len(nbrs)
+    deg = [len(nb) for nb in nbrs]
+    max_deg = max(deg, default=0)
+
+    start = [0] * (max_deg + 1)
+    for d in deg:
+        start[d] += 1
+    offset = 0
+    for d in range(max_deg + 1):
+        start[d], offset = offset, offset + start[d]
+
+    pos = [0] * n
+    vert = [0] * n
+    fill = start.copy()
+    for v in range(n):
+        pos[v] = fill[deg[v]]
+        vert[pos[v]] = v
+        fill[deg[v]] += 1
+
+    degeneracy = 0
+    for i in range(n):
+        v = vert[i]
+        dv = deg[v]
+        if dv > degeneracy:
+            degeneracy = dv
+        for u in nbrs[v]:
+            du = deg[u]
+            if du > dv:
+                pu = pos[u]
+                pw = start[du]
+                w = vert[pw]
+                if u != w:
+                    pos[u], pos[w] = pw, pu
+                    vert[pu], vert[pw] = w, u
+                start[du] += 1
+                deg[u] = du - 1
+
+    return vert, degeneracy
+
+
+def degeneracy_ordering(adjazenz):
+    """
+    Smallest-Last-Reihenfolge (umgekehrte Entfernungsreihenfolge, Knotennummern) und
+    Degeneriertheit d, am ConflictGraph gemerkt. Jeder Knoten hat beim Färben in dieser
+    Reihenfolge höchstens d bereits gefärbte Nachbarn.
+    """
+    def compute(graph):
+        removal, degeneracy = _degeneracy_ordering(graph)
+        return removal[::-1], degeneracy
+
+    return as_conflict_graph(adjazenz).cached("degeneracy", compute)
+
+
+def degeneracy_bound(adjazenz):
+    """Obere Schranke für die Farbanzahl: Degeneriertheit + 1 (ohne zu färben)."""
+    return degeneracy_ordering(adjazenz)[1] + 1
+
+
+def smallest_last_algorithm(adjazenz):
+    """First-Fit in Smallest-Last-Reihenfolge, braucht höchstens Degeneriertheit + 1 Farben."""
+    graph = as_conflict_graph(adjazenz)
+    order, _ = degeneracy_ordering(graph)
+    return graph.coloring_from_indices(first_fit_colors(graph, order))
@@ -0,0 +1,139 @@
+import random
+import time
+
+from functions.analysis import get_graph_stats
+from functions.conflict_graph import as_conflict_graph
+
+
+def _try_k(nbrs, color, k, rng, deadline, max_iter, tenure_base, tenure_alpha):
+    """
+    TabuCol mit k Farben, Start bei color (Werte 0..k-1, darf Konflikte enthalten).
+    gamma[v * k + c] = Anzahl Nachbarn von v mit Farbe c, wird je Zug nur für die
+    Nachbarn des bewegten Knotens angepasst.
+
+    -> (konfliktfreie Färbung oder None, Anzahl Iterationen)
+    """
+    n = len(nbrs)
+    gamma = [0] * (n * k)
+    for v in range(n):
+        base = v * k
+        for u in nbrs[v]:
+            gamma[base + color[u]] += 1
+
+    conflicting = {v for v in range(n) if gamma[v * k + color[v]] > 0}
+    conflicts = sum(gamma[v * k + color[v]] for v in conflicting) // 2
+    best_conflicts = conflicts
+    tabu = [0] * (n * k)
+
+    it = 0
+    while conflicts > 0:
+        if (max_iter is not None and it >= max_iter) or (it % 64 == 0 and time.perf_counter() >= deadline):
+            return None, it
+        it += 1
+
+        best_delta = None
+        moves = []
+        for v in conflicting:
+            base = v * k
+            own = gamma[base + color[v]]
+            for c in range(k):
+                if c == color[v]:
+                    continue
+                delta = gamma[base + c] - own
+                if tabu[base + c] > it and conflicts + delta >= best_conflicts:
+                    continue
+                if best_delta is None or delta < best_delta:
+                    best_delta = delta
+                    moves = [(v, c)]
+                elif delta == best_delta:
+                    moves.append((v, c))
+
+        if not moves:
+            # alle Züge tabu: zufälligen Konfliktknoten auf zufällige Farbe setzen
+            v = rng.choice(list(conflicting))
+            c = rng.choice([c for c in range(k) if c != color[v]])
+            best_delta = gamma[v * k + c] - gamma[v * k + color[v]]
+        else:
+            v, c = moves[rng.randrange(len(moves))]
+
+        old = color[v]
+        color[v] = c
+        conflicts += best_delta
+        tabu[v * k + old] = it + tenure_base + int(tenure_alpha * len(conflicting))
+
+        for u in nbrs[v]:
+            ub = u * k
+            gamma[ub + old] -= 1
+            gamma[ub + c] += 1
+            cu = color[u]
+            if gamma[ub + cu] > 0:
+                conflicting.add(u)
+            else:
+                conflicting.discard(u)
+        if gamma[v * k + c] > 0:
+            conflicting.add(v)
+        else:
+            conflicting.discard(v)
+
+        if conflicts < best_conflicts:
+            best_conflicts = conflicts
+
+    return color, it
+
+
+def tabucol_improve(adjazenz, coloring, time_limit=10.0, seed=0, max_iter=None, tenure_base=10,
+                    tenure_alpha=0.6, lower_bound=None):
+    """
+    Verbesserungsstufe nach einer beliebigen Färbung aus algorithms/:
+    die höchste Farbklasse wird aufgelöst und die entstehenden Konflikte werden per
+    Tabu-Suche (TabuCol) beseitigt. Gelingt das, wird mit einer Farbe weniger weitergemacht.
+
+    - time_limit: Zeitbudget in Sekunden für die gesamte Verbesserung
+    - max_iter: optional maximale Iterationen je Versuch mit k - 1 Farben
+    - lower_bound: bekannte untere Schranke (Standard: gierige Clique), dort wird abgebrochen
+
+    -> Dictionary mit der besten konfliktfreien Färbung und Statistik
+    """
+    t_start = time.perf_counter()
+    deadline = t_start + time_limit
+    graph = as_conflict_graph(adjazenz)
+    nbrs = graph.nbrs
+    rng = random.Random(seed)
+
+    mapping = {c: i for i, c in enumerate(sorted(set(coloring.values())))}
+    best = [mapping[coloring[v]] for v in graph.nodes]
+    initial_k = len(mapping)
+    k = initial_k
+    iterations = 0
+
+    if lower_bound is None:
+        lower_bound = get_graph_stats(graph)["clique_lower_bound"]
+
+    while k > max(1, lower_bound) and time.perf_counter() < deadline:
+        target = k - 1
+        color = best.copy()
+        #### höchste Farbklasse auflösen: jeder Knoten nimmt die Farbe mit den wenigsten Konflikten
+        counts = {}
+        for v in (v for v in range(len(color)) if color[v] == target):
+            counts.clear()
+            for u in nbrs[v]:
+                if color[u] < target:
+                    counts[color[u]] = counts.get(color[u], 0) + 1
+            color[v] = min(range(target), key=lambda c: (counts.get(c, 0), c))
+
+        result, it = _try_k(nbrs, color, target, rng, deadline, max_iter, tenure_base, tenure_alpha)
+        iterations += it
+        if result is None:
+            break
+        best = result
+        k = target
+
+    return {
+        "coloring": graph.coloring_from_indices(best),
+        "k": k,
+        "initial_k": initial_k,
+        "improved": k < initial_k,
+        "lower_bound": lower_bound,
+        "iterations": iterations,
+        "elapsed": time.perf_counter() - t_start,
+    }
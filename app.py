@@ -1,25 +1,150 @@
 import pandas as pd
 import streamlit as st
-import networkx as nx
-import matplotlib.pyplot as plt
 from datetime import date
+from io import BytesIO
 
 # --- Eigene Module ---
-from functions.create_adjacency import (
-    create_adjazenz_list_per_constraint,
-    connect_all_constraints,
-)
-from algorithms.backtracking import backtracking_coloring
-from algorithms.dsatur import dsatur
-from algorithms.greedy import greedy_algorithm
-from algorithms.rlf import rlf_algorithm
-from algorithms.welsh_powell import welsh_powell_algorithm
-from functions.timetable_algo import create_timetable
+from functions.pipeline import (BACKTRACKING, GREEDY, PORTFOLIO, PREFERENCE_ORDERS, STRATEGIES, build_graph,
+                                color_graph, content_hash)
+from functions.timetable_algo import DAYS, HALVES, create_timetable, get_weeks
 from functions.creating_excel import export_detailed_timetable_to_excel
-from functions.analysis import get_edges, get_density, get_highest_degree
+from functions.analysis import get_graph_stats
+from functions.incremental import diff_datasets, recolor_incremental
+from functions.instrumentation import merge_reports, profiling, stage
+from functions.rendering import (DRAW_LIMIT, class_chart_spec, color_class_graph, component_summary, compute_layout,
+                                 draw_matplotlib, graph_chart_spec, graph_hash)
 
 st.set_page_config(page_title="Stundenplan-Optimierung", layout="wide")
 
+# --- Cache: Schlüssel sind Inhalts-Hash der CSV + Spaltenwahl (+ Strategie) ---
+# Parameter mit führendem "_" werden von Streamlit nicht gehasht, sie hängen eindeutig vom Schlüssel ab.
+CACHE_ENTRIES = 8
+CACHE_TTL = "2h"
+
+
+@st.cache_data(max_entries=CACHE_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+def load_dataset(data_key, sep, _data):
+    return pd.read_csv(BytesIO(_data), sep=sep)
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+def cached_graph(graph_key, _df, node_col, constraint_cols):
+    return build_graph(_df, node_col, list(constraint_cols))
+
+
+@st.cache_data(max_entries=CACHE_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+def cached_coloring(coloring_key, _graph, _df, strategy, by_components, time_budget, seed, restarts, tabu_time,
+                    node_col, prefer):
+    def satisfaction(coloring):
+        return create_timetable(_df, _graph, coloring, node_col=node_col)["satisfaction"]
+
+    preferences = None
+    if prefer:
+        rows = _df.drop_duplicates(subset=node_col)
+        preferences = dict(zip(rows[node_col], rows["preferred_time"]))
+    return color_graph(_graph, strategy, by_components=by_components, processes=0, time_limit=time_budget,
+                       seed=seed, restarts=restarts, score=satisfaction, improve_time=tabu_time,
+                       preferences=preferences)
+
+
+@st.cache_data(max_entries=CACHE_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+def cached_timetable(result_key, _df, _graph, _color_dict, days, halves, capacity, node_col):
+    return create_timetable(_df, _graph, _color_dict, days=days and list(days), halves=halves and list(halves),
+                            capacity=capacity, node_col=node_col)
+
+
+# Schlüssel ist der Struktur-Hash des Graphen: gleicher Graph (auch nach inkrementeller Änderung) = gleiches Layout
+@st.cache_data(max_entries=CACHE_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+def cached_layout(layout_key, _adj):
+    return compute_layout(_adj, seed=42)
+
+
+def uncached_if(measuring, cached_fn):
+    """Messläufe rechnen ohne Zwischenspeicher, damit alle Abschnitte im Performance-Report erscheinen."""
+    return cached_fn.__wrapped__ if measuring else cached_fn
+
+
+def run_coloring(data, data_key, sep, node_col, constraint_cols, strategy, by_components, time_budget, seed,
+                 restarts, tabu_time, prefer, slot_model, incremental, measuring=False):
+    """Graph, Färbung und Stundenplan für "Färbung ausführen"; Ergebnisse landen in st.session_state."""
+    #### Messläufe lesen die CSV erneut ein, damit das Einlesen im Report erscheint
+    with stage("CSV einlesen"):
+        df = uncached_if(measuring, load_dataset)(data_key, sep, data)
+
+    graph_key = (data_key, sep, node_col, tuple(constraint_cols))
+    st.session_state.pop("exact_result", None)
+    st.session_state.pop("multistart_result", None)
+    st.session_state.pop("portfolio_result", None)
+    st.session_state.pop("tabu_result", None)
+    st.session_state.pop("incremental_result", None)
+
+    inc = None
+    if incremental:
+        # zwischengespeicherter Graph des letzten Laufs wird nicht verändert
+        all_edges = st.session_state["all_edges"].copy()
+        diff = diff_datasets(st.session_state["dataset"], df, node_col)
+        try:
+            inc = recolor_incremental(all_edges, df, diff, st.session_state["color_dict"],
+                                      st.session_state["timetable_result"], node_col, constraint_cols)
+        except ValueError as e:
+            st.info(f"{e} – es wird vollständig neu geplant.")
+    if inc is not None:
+        result_key = graph_key + ("inkrementell", st.session_state["result_key"])
+        color_dict = inc["coloring"]
+        timetable_raw = inc["timetable"]
+        edge_counts = None
+        st.session_state["incremental_result"] = {k: v for k, v in inc.items() if k not in ("coloring", "timetable")}
+    else:
+        coloring_key = graph_key + (strategy, by_components, time_budget, seed, restarts, tabu_time, prefer)
+        result_key = coloring_key + slot_model
+
+        all_edges, edge_counts = uncached_if(measuring, cached_graph)(graph_key, df, node_col,
+                                                                      tuple(constraint_cols))
+        color_dict, details = uncached_if(measuring, cached_coloring)(coloring_key, all_edges, df, strategy,
+                                                                      by_components, time_budget, seed, restarts,
+                                                                      tabu_time, node_col, prefer)
+        if strategy == BACKTRACKING:
+            st.session_state["exact_result"] = details
+        elif strategy == PORTFOLIO:
+            st.session_state["portfolio_result"] = {k: v for k, v in details.items() if k != "coloring"}
+        elif details is not None and "restarts" in details:
+            st.session_state["multistart_result"] = details
+        if details is not None and "tabu" in details:
+            st.session_state["tabu_result"] = details["tabu"]
+
+        timetable_raw = uncached_if(measuring, cached_timetable)(result_key, df, all_edges, color_dict,
+                                                                 *slot_model, node_col)
+
+    st.session_state["timetable_result"] = timetable_raw
+    st.session_state["color_count"] = timetable_raw["k"]
+    st.session_state["satisfaction"] = timetable_raw["satisfaction"]
+    st.session_state["dataset"] = df
+    st.session_state["node_col"] = node_col
+    st.session_state["all_edges"] = all_edges
+    st.session_state["all_nodes"] = df[node_col].astype(str).unique().tolist()
+    st.session_state["adjacency"] = all_edges
+    st.session_state["color_dict"] = color_dict
+    st.session_state["edge_counts"] = edge_counts
+    st.session_state["graph_key"] = graph_key
+    st.session_state["result_key"] = result_key
+    st.session_state["slot_model"] = slot_model
+
+
+@st.cache_data(max_entries=CACHE_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+def cached_excel(result_key, _result, _df, start_date, course_col, room_col, instructor_col, title_col):
+    return export_detailed_timetable_to_excel(
+        result=_result,
+        dataset=_df,
+        start_date=start_date,
+        file_path=None,
+        course_col=course_col,
+        room_col=room_col,
+        instructor_col=instructor_col,
+        title_col=title_col,
+        use_german_headers=True
+    )
+
+
 st.title("Stundenplan-Optimierung mit Graphfärbung")
 
 st.markdown("""
@@ -46,8 +171,10 @@ with left:
     delimiter = st.selectbox("Trennzeichen", [",", ";", "\\t"], format_func=lambda s: {"\\t": "Tab"}.get(s, s))
     if file:
         sep = {"\\t": "\t"}.get(delimiter, delimiter)
+        data = file.getvalue()
+        data_key = content_hash(data)
         try:
-            df = pd.read_csv(file, sep=sep)
+            df = load_dataset(data_key, sep, data)
         except Exception as e:
             st.error(f"CSV konnte nicht gelesen werden: {e}")
             df = None
@@ -65,60 +192,79 @@ with left:
 
             strategy = st.selectbox(
                 "Färbe-Strategie",
-                ["Greedy-Algorithmus", "Welsh-Powell-Algorithmus", "Backtracking-Algorithmus", "DSATUR-Algorithmus", "RLF-Algorithmus"],
+                list(STRATEGIES),
             )
 
+            time_budget = None
+            if strategy == BACKTRACKING:
+                time_budget = st.number_input("Zeitbudget Backtracking (Sekunden)", min_value=1, max_value=600,
+                                              value=30, step=1)
+            elif strategy == PORTFOLIO:
+                time_budget = st.number_input("Zeitbudget Portfolio (Sekunden, alle Strategien parallel)",
+                                              min_value=1, max_value=600, value=10, step=1)
+
+            seed, restarts = None, 1
+            if strategy == GREEDY:
+                g1, g2 = st.columns(2)
+                seed = int(g1.number_input("Seed", min_value=0, value=0, step=1))
+                restarts = int(g2.number_input("Neustarts (bestes Ergebnis)", min_value=1, max_value=10000,
+                                               value=32, step=1))
+
+            tabu_time = int(st.number_input("Tabu-Suche zur Farbreduktion (Sekunden, 0 = aus)", min_value=0,
+                                            max_value=600, value=0, step=1))
+
+            by_components = st.checkbox("Zusammenhangskomponenten getrennt (parallel) färben", value=True)
+
+            prefer = False
+            if "preferred_time" in df.columns and (strategy in PREFERENCE_ORDERS or strategy == PORTFOLIO):
+                prefer = st.checkbox("Präferenzen schon beim Färben berücksichtigen (Farbklassen mit "
+                                     "einheitlicher Morning/Afternoon-Tendenz)", value=False)
+
+            with st.expander("Slot-Modell (Tage, Perioden, Kapazität)"):
+                days = st.multiselect("Unterrichtstage", ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"], default=DAYS)
+                halves_text = st.text_input("Perioden je Tag (kommagetrennt, Namen wie in der Präferenz-Spalte)",
+                                            value=", ".join(HALVES))
+                capacity = int(st.number_input("Kurse je Slot (z.B. verfügbare Räume, 0 = eine Farbklasse je Slot)",
+                                               min_value=0, value=0, step=1))
+            halves = [h.strip() for h in halves_text.split(",") if h.strip()]
+            #### Standardmodell (Mo-Fr x Morning/Afternoon, eine Farbklasse je Slot) -> None
+            slot_model = (tuple(days), tuple(halves), capacity or None)
+            if slot_model == (tuple(DAYS), tuple(HALVES), None):
+                slot_model = (None, None, None)
+
+            #### gleiche Spaltenwahl wie im letzten Lauf, aber geänderte Daten: nur Änderungen neu einplanen
+            #### (nur im Standard-Slotmodell, im aktuellen wie im letzten Lauf)
+            incremental = False
+            prev_key = st.session_state.get("graph_key")
+            default_model = (None, None, None)
+            if prev_key is not None and prev_key[0] != data_key and slot_model == default_model and \
+                    st.session_state.get("slot_model") == default_model and \
+                    prev_key[2:] == (node_col, tuple(constraint_cols)):
+                incremental = st.checkbox("Nur Änderungen gegenüber dem letzten Lauf neu einplanen "
+                                          "(bisherigen Stundenplan beibehalten)", value=True)
+
+            with st.expander("Performance-Messung"):
+                measure = st.checkbox("Laufzeiten je Abschnitt und Zähler messen", value=False)
+                use_cprofile = st.checkbox("zusätzlich cProfile aufzeichnen", value=False, disabled=not measure)
+
             run = st.button("Färbung ausführen", type="primary")
 
+            perf_report = None
             if run:
                 if not node_col:
                     st.warning("Bitte eine Knoten-Spalte auswählen.")
                 elif not constraint_cols:
                     st.warning("Bitte mindestens eine Constraint-Spalte auswählen.")
+                elif not days or not halves:
+                    st.warning("Bitte mindestens einen Tag und eine Periode angeben.")
                 else:
-                    all_constraint_dicts = []
-                    node_index = df.columns.get_loc(node_col)
-                    for c in constraint_cols:
-                        c_index = df.columns.get_loc(c)
-                        ajd_dict = create_adjazenz_list_per_constraint(df, node_index, c_index)
-                        all_constraint_dicts.append(ajd_dict)
-
-                    all_edges = connect_all_constraints(*all_constraint_dicts)
-
-                    if strategy == "Greedy-Algorithmus":
-                        color_dict = greedy_algorithm(all_edges)
-                    elif strategy == "Welsh-Powell-Algorithmus":
-                        color_dict = welsh_powell_algorithm(all_edges)
-                    elif strategy == "DSATUR-Algorithmus":
-                        color_dict = dsatur(all_edges)
-                    elif strategy == "RLF-Algorithmus":
-                        color_dict = rlf_algorithm(all_edges)
-                    elif strategy == "Backtracking-Algorithmus":
-                        color_dict = backtracking_coloring(all_edges)
-
-                    timetable_raw = create_timetable(df, all_edges, color_dict)
-
-                    st.session_state["timetable_result"] = timetable_raw
-                    st.session_state["color_count"] = timetable_raw["k"]
-                    st.session_state["satisfaction"] = timetable_raw["satisfaction"]
-                    st.session_state["dataset"] = df
-                    st.session_state["node_col"] = node_col
-                    st.session_state["all_edges"] = all_edges
-                    st.session_state["all_nodes"] = df[node_col].astype(str).unique().tolist()
-                    st.session_state["adjacency"] = all_edges
-                    st.session_state["color_dict"] = color_dict
-
-
-                    def _edges_from_adj(adj):
-                        return list({tuple(sorted((str(u), str(v)))) for u in adj for v in adj[u] if str(u) != str(v)})
-
-
-                    G_tmp = nx.Graph()
-                    G_tmp.add_nodes_from(df[node_col].astype(str).unique().tolist())
-                    G_tmp.add_edges_from(_edges_from_adj(all_edges))
-                    pos = nx.spring_layout(G_tmp, seed=42)
-                    st.session_state["graph_pos"] = pos
-
+                    #### nur der Lauf nach dem Klick wird gemessen, ohne Zwischenspeicher
+                    with profiling(enabled=measure, cprofile=use_cprofile) as perf_report:
+                        run_coloring(data, data_key, sep, node_col, constraint_cols, strategy, by_components,
+                                     time_budget, seed, restarts, tabu_time, prefer, slot_model, incremental,
+                                     measuring=measure)
+                    if perf_report is not None:
+                        st.session_state["perf_report"] = perf_report
 
             if "timetable_result" in st.session_state:
                 st.markdown("---")
@@ -163,17 +309,20 @@ with left:
 
 
                 try:
-                    xls_bytes = export_detailed_timetable_to_excel(
-                        result=st.session_state["timetable_result"],
-                        dataset=df_for_export,
-                        start_date=start_dt_str,
-                        file_path=None,
-                        course_col=course_col,
-                        room_col=room_col,
-                        instructor_col=instructor_col,
-                        title_col=title_col,
-                        use_german_headers=True
-                    )
+                    #### der Export direkt nach einem Messlauf kommt in dessen Report
+                    with profiling(enabled=perf_report is not None, cprofile=use_cprofile) as export_report:
+                        xls_bytes = uncached_if(export_report is not None, cached_excel)(
+                            st.session_state["result_key"],
+                            st.session_state["timetable_result"],
+                            df_for_export,
+                            start_dt_str,
+                            course_col,
+                            room_col,
+                            instructor_col,
+                            title_col,
+                        )
+                    if export_report is not None:
+                        st.session_state["perf_report"] = merge_reports(perf_report, export_report)
                     st.download_button(
                         "Stundenplan als Excel herunterladen",
                         data=xls_bytes,
@@ -191,14 +340,17 @@ with right:
     if "all_edges" in st.session_state and st.session_state["all_edges"] is not None:
         adj = st.session_state["all_edges"]
 
-        e_count = get_edges(adj)
-        max_deg = get_highest_degree(adj)
-        dens = get_density(adj)
+        graph_key = st.session_state["graph_key"]
+        # am (zwischengespeicherten) Graphen gemerkt, bei weiteren Interaktionen ohne Rechenaufwand
+        stats = get_graph_stats(adj)
 
         c1, c2, c3 = st.columns(3)
-        c1.metric("Anzahl Kanten", e_count)
-        c2.metric("Maximaler Grad", max_deg)
-        c3.metric("Dichte", f"{dens:.3f}")
+        c1.metric("Anzahl Kanten", stats["edges"])
+        c2.metric("Maximaler Grad", stats["max_degree"])
+        c3.metric("Dichte", f"{stats['density']:.3f}")
+        st.caption(f"{stats['components']} Zusammenhangskomponente(n), Clique mit {stats['clique_lower_bound']} "
+                   f"Kursen ⇒ mindestens {stats['clique_lower_bound']} Farben; Degeneriertheit ⇒ höchstens "
+                   f"{stats['degeneracy_upper_bound']} Farben ({get_weeks(stats['degeneracy_upper_bound'])} Woche(n))")
 
         if "timetable_result" in st.session_state:
             tr = st.session_state["timetable_result"]
@@ -207,48 +359,85 @@ with right:
             c5.metric("Soft-Constraint-Score", f"{tr['satisfaction'] * 100:.1f}%")
             c6.metric("Erfüllte Präferenzen", f"{tr['satisfied']} / {tr['total']}")
 
-
-        def _edges_from_adj(adj):
-            return list({tuple(sorted((str(u), str(v)))) for u in adj for v in adj[u] if str(u) != str(v)})
-
-
-        nodes = list({str(u) for u in adj.keys()})
-        edges = _edges_from_adj(adj)
-        G = nx.Graph()
-        G.add_nodes_from(nodes)
-        G.add_edges_from(edges)
-        pos = st.session_state.get("graph_pos")
-        if pos is None:
-            pos = nx.spring_layout(G, seed=42)
-            st.session_state["graph_pos"] = pos
+        if "exact_result" in st.session_state:
+            ex = st.session_state["exact_result"]
+            if ex["proven_optimal"]:
+                st.success(f"Optimal bewiesen: {ex['k']} Farben ({ex['nodes']} Suchknoten, {ex['elapsed']:.1f} s)")
+            else:
+                st.warning(f"Budget erschöpft: beste Färbung {ex['k']} Farben, untere Schranke "
+                           f"{ex['lower_bound']} (Lücke {ex['gap']}, {ex['nodes']} Suchknoten)")
+
+        if "multistart_result" in st.session_state:
+            ms = st.session_state["multistart_result"]
+            st.caption(f"Greedy-Mehrfachstart: {ms['restarts']} Läufe, beste Farbanzahl {ms['k']} (Seed {ms['seed']}); "
+                       "Verteilung: " + ", ".join(f"{k} Farben × {n}" for k, n in ms["distribution"].items()))
+
+        if "portfolio_result" in st.session_state:
+            pf = st.session_state["portfolio_result"]
+            status = "optimal bewiesen" if pf["proven_optimal"] else f"untere Schranke {pf['lower_bound']}"
+            st.caption(f"Portfolio: {pf['strategy']} gewinnt mit {pf['k']} Farben ({status}, {pf['elapsed']:.1f} s); "
+                       + ", ".join(f"{r['strategy']}: {r['k']}" for r in pf["runs"] if "k" in r)
+                       + (f"; abgebrochen: {', '.join(pf['cancelled'])}" if pf["cancelled"] else ""))
+
+        if "tabu_result" in st.session_state:
+            tb = st.session_state["tabu_result"]
+            st.caption(f"Tabu-Suche: {tb['initial_k']} -> {tb['k']} Farben (untere Schranke {tb['lower_bound']}, "
+                       f"{tb['iterations']} Iterationen, {tb['elapsed']:.1f} s)")
+
+        if "incremental_result" in st.session_state:
+            inc = st.session_state["incremental_result"]
+            st.caption(f"Inkrementell: {inc['added']} neu, {inc['removed']} entfernt, {inc['changed']} geändert; "
+                       f"{inc['recolored']} Kurse umgefärbt, {inc['moved']} bestehende Kurse verschoben")
+
+        if st.session_state.get("edge_counts"):
+            st.caption("Konfliktpaare je Constraint: " + ", ".join(
+                f"{col}: {cnt}" for col, cnt in st.session_state["edge_counts"].items()))
+
+        if "perf_report" in st.session_state:
+            perf = st.session_state["perf_report"]
+            with st.expander(f"Performance ({perf['total']:.2f} s)"):
+                stages = pd.DataFrame(perf["stages"], columns=["stage", "seconds", "calls"])
+                stages["Anteil"] = stages["seconds"] / perf["total"] if perf["total"] else 0.0
+                st.dataframe(stages.rename(columns={"stage": "Abschnitt", "seconds": "Sekunden", "calls": "Aufrufe"}),
+                             hide_index=True)
+                st.dataframe(pd.DataFrame(list(perf["counters"].items()), columns=["Zähler", "Wert"]),
+                             hide_index=True)
+                if perf["profile"]:
+                    st.markdown("**cProfile (kumulierte Zeit)**")
+                    st.dataframe(pd.DataFrame(perf["profile"]), hide_index=True)
+                st.caption("Gemessen wird der letzte Lauf mit aktivierter Messung samt CSV-Einlesen und "
+                           "Excel-Export, ohne Zwischenspeicher (Graph-Darstellung nicht enthalten).")
 
         color_dict = st.session_state.get("color_dict", {})
 
-        node_count = G.number_of_nodes()
-        node_size = max(100, 8000 / max(1, node_count))
-        font_size = max(4, 14 - node_count / 10)
-
-        st.markdown("**Konfliktgraph (ungefärbt)**")
-        plt.figure(figsize=(6.0, 5.0))
-        nx.draw_networkx_nodes(G, pos, node_size=node_size)
-        nx.draw_networkx_edges(G, pos, width=1.0, alpha=0.6)
-        nx.draw_networkx_labels(G, pos, font_size=font_size)
-        plt.axis("off")
-        st.pyplot(plt.gcf())
-
-        if color_dict:
-            st.markdown("**Konfliktgraph (gefärbt)**")
-
-            node_colors = [color_dict.get(n, color_dict.get(str(n), -1)) for n in G.nodes()]
-            cmap = plt.cm.tab20
-            plt.figure(figsize=(6.0, 5.0))
-            nx.draw_networkx_nodes(G, pos, node_size=node_size, node_color=node_colors, cmap=cmap)
-            nx.draw_networkx_edges(G, pos, width=1.0, alpha=0.6)
-            nx.draw_networkx_labels(G, pos, font_size=font_size)
-            plt.axis("off")
-            st.pyplot(plt.gcf())
+        if len(adj) <= DRAW_LIMIT:
+            renderer = st.radio("Darstellung", ["Interaktiv (Vega-Lite)", "Bild (matplotlib)"], horizontal=True)
+            pos = cached_layout(graph_hash(adj), adj)
+
+            def show(coloring):
+                if renderer.startswith("Interaktiv"):
+                    st.vega_lite_chart(graph_chart_spec(adj, pos, coloring))
+                else:
+                    st.pyplot(draw_matplotlib(adj, pos, coloring))
+
+            st.markdown("**Konfliktgraph (ungefärbt)**")
+            show(None)
+            if color_dict:
+                st.markdown("**Konfliktgraph (gefärbt)**")
+                show(color_dict)
+            else:
+                st.info("Noch keine Färbung vorhanden.")
         else:
-            st.info("Noch keine Färbung vorhanden.")
+            #### zu groß zum Zeichnen: Farbklassen und Komponenten zusammengefasst
+            st.caption(f"{len(adj)} Kurse – statt des Graphen wird eine zusammengefasste Ansicht gezeigt.")
+            if color_dict:
+                classes, class_edges = color_class_graph(adj, color_dict)
+                st.markdown("**Farbklassen (Kreisgröße = Kurse, Linienstärke = Konflikte zwischen den Klassen)**")
+                st.vega_lite_chart(class_chart_spec(classes, class_edges))
+            else:
+                st.info("Noch keine Färbung vorhanden.")
+            st.markdown("**Zusammenhangskomponenten**")
+            st.dataframe(component_summary(adj), hide_index=True)
 
     else:
         st.info("Bitte links die Färbung ausführen – dann erscheinen hier die Kennzahlen.")
@@ -0,0 +1,50 @@
+"""
+Vergleich der bisherigen DSATUR-Implementierung (dsatur) mit der Heap-Variante (dsatur_heap).
+
+    python -m benchmarks.bench_dsatur --sizes 1000 10000 50000
+"""
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from algorithms.dsatur import dsatur, dsatur_heap
+from benchmarks.synthetic import BUNDLED_DATASETS, CONSTRAINT_COLUMNS, generate_catalogue
+from functions.create_adjacency import build_conflict_graph
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _time(fn, graph):
+    t0 = time.perf_counter()
+    coloring = fn(graph)
+    return time.perf_counter() - t0, 1 + max(coloring.values()) if coloring else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[1000, 10000, 50000])
+    parser.add_argument("--legacy-limit", type=int, default=10000,
+                        help="dsatur (O(V^2)) nur bis zu dieser Knotenanzahl messen")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    datasets = [(name, pd.read_csv(os.path.join(ROOT, path))) for name, path in BUNDLED_DATASETS.items()]
+    datasets += [(f"synthetic-{n}", generate_catalogue(n, seed=args.seed)) for n in args.sizes]
+
+    print(f"{'Datensatz':<18}{'Knoten':>8}{'Kanten':>10}{'dsatur [s]':>12}{'k':>5}{'heap [s]':>12}{'k':>5}")
+    for name, df in datasets:
+        c_indices = [df.columns.get_loc(c) for c in CONSTRAINT_COLUMNS]
+        graph, _ = build_conflict_graph(df, 0, c_indices)
+        t_heap, k_heap = _time(dsatur_heap, graph)
+        if len(graph) <= args.legacy_limit:
+            t_old, k_old = _time(dsatur, graph)
+            old = f"{t_old:>12.3f}{k_old:>5}"
+        else:
+            old = f"{'-':>12}{'-':>5}"
+        print(f"{name:<18}{len(graph):>8}{graph.number_of_edges():>10}{old}{t_heap:>12.3f}{k_heap:>5}")
+
+
+if __name__ == "__main__":
+    main()
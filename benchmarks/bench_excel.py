@@ -0,0 +1,45 @@
+"""
+Vergleich des Excel-Exports: openpyxl (Formatierung je Zelle) gegen xlsxwriter (constant_memory).
+
+    python -m benchmarks.bench_excel --sizes 5000 20000 --capacity 40
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from algorithms.dsatur import dsatur_heap
+from benchmarks.synthetic import CONSTRAINT_COLUMNS, generate_catalogue
+from functions.create_adjacency import build_conflict_graph
+from functions.creating_excel import export_detailed_timetable_to_excel
+from functions.timetable_algo import create_timetable
+
+
+def _time(result, df, engine, path):
+    t0 = time.perf_counter()
+    export_detailed_timetable_to_excel(result, df, "2025-01-06", file_path=path, course_col=df.columns[0],
+                                       title_col="title", engine=engine)
+    return time.perf_counter() - t0, os.path.getsize(path) / 1024
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[5000, 20000])
+    parser.add_argument("--capacity", type=int, default=40, help="Kurse je Slot (mehr Wochenblätter)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{'Kurse':>8}{'Wochen':>8}{'openpyxl [s]':>14}{'xlsxwriter [s]':>16}{'KiB':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            df = generate_catalogue(n, seed=args.seed)
+            c_indices = [df.columns.get_loc(c) for c in CONSTRAINT_COLUMNS]
+            graph, _ = build_conflict_graph(df, 0, c_indices)
+            result = create_timetable(df, graph, dsatur_heap(graph), capacity=args.capacity)
+            t_old, _ = _time(result, df, "openpyxl", os.path.join(tmp, "openpyxl.xlsx"))
+            t_new, size = _time(result, df, "xlsxwriter", os.path.join(tmp, "xlsxwriter.xlsx"))
+            print(f"{n:>8}{result['weeks']:>8}{t_old:>14.3f}{t_new:>16.3f}{size:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Soft-Constraint-Score mit und ohne präferenzbewusste Farbwahl (gleiche Strategie, gleiche Reihenfolge).
+Gefärbt wird wie in der App (Komponenten getrennt); "medium-2x" besteht aus zwei unabhängigen Kopien
+von medium mit gegensätzlichen Präferenzen (mehrere Komponenten).
+
+    python -m benchmarks.bench_preferences
+    python -m benchmarks.bench_preferences --sizes 1000 10000
+"""
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import BUNDLED_DATASETS, CONSTRAINT_COLUMNS, generate_catalogue
+from functions.pipeline import PREFERENCE_ORDERS, build_graph, color_graph
+from functions.timetable_algo import create_timetable
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _disjoint_copies(df, columns):
+    """Zweite, konfliktfreie Kopie des Katalogs (eigene IDs und Constraint-Werte) mit vertauschten Präferenzen."""
+    copy = df.copy()
+    for c in columns:
+        copy[c] = copy[c].astype(str) + "-2"
+    copy["preferred_time"] = copy["preferred_time"].map({"Morning": "Afternoon", "Afternoon": "Morning"})
+    return pd.concat([df, copy], ignore_index=True)
+
+
+def _run(df, graph, strategy, preferences, seed):
+    t0 = time.perf_counter()
+    coloring, _ = color_graph(graph, strategy, processes=None, seed=seed, preferences=preferences)
+    elapsed = time.perf_counter() - t0
+    result = create_timetable(df, graph, coloring)
+    return result["k"], result["satisfaction"], elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[], help="zusätzliche synthetische Kataloge")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    datasets = [(name, pd.read_csv(os.path.join(ROOT, path))) for name, path in BUNDLED_DATASETS.items()]
+    datasets.append(("medium-2x", _disjoint_copies(dict(datasets)["medium"], ["course_id", *CONSTRAINT_COLUMNS])))
+    datasets += [(f"synthetic-{n}", generate_catalogue(n, seed=args.seed)) for n in args.sizes]
+
+    print(f"{'Datensatz':<18}{'Strategie':<28}{'k':>4}{'Score':>8}{'[s]':>8}{'k':>6}{'Score':>8}{'[s]':>8}"
+          f"{'Gewinn':>9}")
+    for name, df in datasets:
+        graph, _ = build_graph(df, "course_id", CONSTRAINT_COLUMNS)
+        rows = df.drop_duplicates(subset="course_id")
+        preferences = dict(zip(rows["course_id"], rows["preferred_time"]))
+        for strategy in PREFERENCE_ORDERS:
+            k_old, s_old, t_old = _run(df, graph, strategy, None, args.seed)
+            k_new, s_new, t_new = _run(df, graph, strategy, preferences, args.seed)
+            print(f"{name:<18}{strategy:<28}{k_old:>4}{s_old * 100:>7.1f}%{t_old:>8.3f}"
+                  f"{k_new:>6}{s_new * 100:>7.1f}%{t_new:>8.3f}{(s_new - s_old) * 100:>+8.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Vergleich von rlf_algorithm mit rlf_incremental (Laufzeit und identische Färbung).
+
+    python -m benchmarks.bench_rlf --sizes 1000 5000
+"""
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from algorithms.rlf import rlf_algorithm, rlf_incremental
+from benchmarks.synthetic import BUNDLED_DATASETS, CONSTRAINT_COLUMNS, generate_catalogue
+from functions.create_adjacency import build_conflict_graph
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[1000, 5000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    datasets = [(name, pd.read_csv(os.path.join(ROOT, path))) for name, path in BUNDLED_DATASETS.items()]
+    datasets += [(f"synthetic-{n}", generate_catalogue(n, seed=args.seed)) for n in args.sizes]
+
+    print(f"{'Datensatz':<18}{'Knoten':>8}{'Kanten':>10}{'rlf [s]':>10}{'inkr. [s]':>11}{'k':>5}  identisch")
+    for name, df in datasets:
+        c_indices = [df.columns.get_loc(c) for c in CONSTRAINT_COLUMNS]
+        graph, _ = build_conflict_graph(df, 0, c_indices)
+
+        t0 = time.perf_counter()
+        expected = rlf_algorithm(graph)
+        t1 = time.perf_counter()
+        actual = rlf_incremental(graph)
+        t2 = time.perf_counter()
+
+        same = expected == actual
+        k = 1 + max(actual.values()) if actual else 0
+        print(f"{name:<18}{len(graph):>8}{graph.number_of_edges():>10}{t1 - t0:>10.3f}{t2 - t1:>11.3f}{k:>5}  {same}")
+        if not same:
+            raise SystemExit(f"rlf_incremental weicht auf {name} von rlf_algorithm ab")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Benchmark aller Färbe-Strategien auf den mitgelieferten und auf synthetischen Katalogen.
+
+    python -m benchmarks.run_benchmarks --sizes 1000 10000 100000 --out bench/
+    python -m benchmarks.run_benchmarks --compare bench/alt.json
+
+Jeder Lauf (Strategie x Datensatz) läuft in einem eigenen Prozess, damit Spitzenspeicher
+und Zeitlimit sauber gemessen werden. Gemessen werden Laufzeit (Graphaufbau, Färbung,
+Slot-Zuweisung), Spitzenspeicher (RSS), Anzahl Farben und Soft-Constraint-Score aus
+create_timetable. Ergebnisse werden als JSON und CSV geschrieben.
+"""
+import argparse
+import csv
+import json
+import multiprocessing as mp
+import os
+import platform
+import resource
+import subprocess
+import time
+from datetime import datetime
+
+from benchmarks.synthetic import BUNDLED_DATASETS, CONSTRAINT_COLUMNS, generate_catalogue
+from functions.pipeline import STRATEGIES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FIELDS = ["dataset", "courses", "edges", "strategy", "status", "build_s", "color_s", "timetable_s",
+          "total_s", "peak_rss_mb", "colors", "satisfaction"]
+
+
+def _load(spec):
+    import pandas as pd
+    kind, value, seed = spec
+    if kind == "csv":
+        return pd.read_csv(os.path.join(ROOT, value))
+    return generate_catalogue(value, seed=seed)
+
+
+def _peak_rss_mb():
+    # Linux: KiB, macOS: Bytes
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if platform.system() == "Darwin" else peak / 1024
+
+
+def _run(spec, strategy, by_components, time_limit, queue):
+    from functions.pipeline import build_graph, color_graph
+    from functions.timetable_algo import create_timetable
+
+    df = _load(spec)
+    t0 = time.perf_counter()
+    graph, _ = build_graph(df, df.columns[0], CONSTRAINT_COLUMNS)
+    t1 = time.perf_counter()
+    coloring, _ = color_graph(graph, strategy, by_components=by_components, processes=None,
+                              time_limit=time_limit, seed=spec[2] or 0)
+    t2 = time.perf_counter()
+    result = create_timetable(df, graph, coloring)
+    t3 = time.perf_counter()
+
+    queue.put({
+        "courses": len(graph),
+        "edges": graph.number_of_edges(),
+        "status": "ok",
+        "build_s": round(t1 - t0, 4),
+        "color_s": round(t2 - t1, 4),
+        "timetable_s": round(t3 - t2, 4),
+        "total_s": round(t3 - t0, 4),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "colors": result["k"],
+        "satisfaction": round(result["satisfaction"], 4),
+    })
+
+
+def run_one(spec, strategy, by_components=True, time_limit=10.0, timeout=600.0):
+    """Einen Lauf in einem eigenen Prozess ausführen -> Messwerte (oder Status timeout/error)."""
+    queue = mp.Queue()
+    proc = mp.Process(target=_run, args=(spec, strategy, by_components, time_limit, queue))
+    proc.start()
+    proc.join(timeout)
+    if proc.is_alive():
+        proc.terminate()
+        proc.join()
+        return {"status": "timeout"}
+    if queue.empty():
+        return {"status": f"error (exit {proc.exitcode})"}
+    return queue.get()
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current, previous, time_tolerance=0.25):
+    """Regressionen gegenüber einem früheren Lauf: mehr Farben oder deutlich langsamer."""
+    old = {(r["dataset"], r["strategy"]): r for r in previous["runs"] if r.get("status") == "ok"}
+    regressions = []
+    for r in current["runs"]:
+        prev = old.get((r["dataset"], r["strategy"]))
+        if prev is None or r.get("status") != "ok":
+            continue
+        if r["colors"] > prev["colors"]:
+            regressions.append(f"{r['dataset']} / {r['strategy']}: {prev['colors']} -> {r['colors']} Farben")
+        if r["total_s"] > prev["total_s"] * (1 + time_tolerance) and r["total_s"] - prev["total_s"] > 0.05:
+            regressions.append(f"{r['dataset']} / {r['strategy']}: {prev['total_s']:.3f} s -> {r['total_s']:.3f} s")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[1000, 10000, 100000],
+                        help="Größen der synthetischen Kataloge")
+    parser.add_argument("--strategies", nargs="*", default=list(STRATEGIES), choices=list(STRATEGIES))
+    parser.add_argument("--no-bundled", action="store_true", help="mitgelieferte CSV-Dateien nicht messen")
+    parser.add_argument("--no-components", action="store_true", help="ohne Zerlegung in Komponenten färben")
+    parser.add_argument("--time-limit", type=float, default=10.0, help="Zeitbudget Backtracking je Lauf")
+    parser.add_argument("--timeout", type=float, default=600.0, help="Abbruch eines Laufs nach Sekunden")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="bench", help="Ausgabeverzeichnis für JSON/CSV")
+    parser.add_argument("--compare", default=None, help="früheres JSON-Ergebnis für Regressionsvergleich")
+    args = parser.parse_args(argv)
+
+    specs = []
+    if not args.no_bundled:
+        specs += [(name, ("csv", path, None)) for name, path in BUNDLED_DATASETS.items()]
+    specs += [(f"synthetic-{n}", ("synthetic", n, args.seed)) for n in args.sizes]
+
+    runs = []
+    print(f"{'Datensatz':<18}{'Strategie':<26}{'Status':<9}{'Zeit [s]':>10}{'RSS [MB]':>10}{'k':>5}{'Score':>8}")
+    for name, spec in specs:
+        for strategy in args.strategies:
+            r = {"dataset": name, "strategy": strategy}
+            r.update(run_one(spec, strategy, by_components=not args.no_components,
+                             time_limit=args.time_limit, timeout=args.timeout))
+            runs.append(r)
+            if r["status"] == "ok":
+                print(f"{name:<18}{strategy:<26}{'ok':<9}{r['total_s']:>10.3f}{r['peak_rss_mb']:>10.1f}"
+                      f"{r['colors']:>5}{r['satisfaction'] * 100:>7.1f}%")
+            else:
+                print(f"{name:<18}{strategy:<26}{r['status']:<9}")
+
+    report = {
+        "commit": _git_commit(),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "runs": runs,
+    }
+
+    os.makedirs(args.out, exist_ok=True)
+    stamp = f"{datetime.now():%Y%m%d-%H%M%S}-{report['commit'] or 'nogit'}"
+    json_path = os.path.join(args.out, f"bench-{stamp}.json")
+    csv_path = os.path.join(args.out, f"bench-{stamp}.csv")
+    with open(json_path, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, ensure_ascii=False, indent=2)
+    with open(csv_path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(runs)
+    print(f"\nErgebnisse: {json_path}, {csv_path}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            previous = json.load(fh)
+        regressions = compare(report, previous)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,34 @@
+import random
+
+import pandas as pd
+
+
+##############################################################################################
+#### Synthetische Kurskataloge im Format der mitgelieferten CSV-Dateien
+def generate_catalogue(n_courses, seed=0, courses_per_lecturer=5, courses_per_group=20, courses_per_room=10):
+    """
+    Erzeugt einen Katalog mit den Spalten course_id, title, lecturer, group, room, preferred_time.
+    Die Anzahl verschiedener Werte je Constraint wächst mit der Kursanzahl,
+    dadurch bleibt der mittlere Knotengrad (wie bei echten Katalogen) etwa konstant.
+    """
+    rng = random.Random(seed)
+    n_lecturers = max(1, n_courses // courses_per_lecturer)
+    n_groups = max(1, n_courses // courses_per_group)
+    n_rooms = max(1, n_courses // courses_per_room)
+    return pd.DataFrame({
+        "course_id": [f"K{i + 1}" for i in range(n_courses)],
+        "title": [f"Kurs {i + 1}" for i in range(n_courses)],
+        "lecturer": [f"L{rng.randrange(n_lecturers)}" for _ in range(n_courses)],
+        "group": [f"G{rng.randrange(n_groups)}" for _ in range(n_courses)],
+        "room": [f"R{rng.randrange(n_rooms)}" for _ in range(n_courses)],
+        "preferred_time": [rng.choice(["Morning", "Afternoon"]) for _ in range(n_courses)],
+    })
+
+
+BUNDLED_DATASETS = {
+    "small": "courses_small_simple.csv",
+    "medium": "courses_medium_simple.csv",
+    "large": "courses_large_simple.csv",
+}
+
+CONSTRAINT_COLUMNS = ["lecturer", "group", "room"]
@@ -0,0 +1,255 @@
+"""
+Stundenplan ohne Streamlit erzeugen (einzelne CSV oder ganzes Verzeichnis).
+
+    python -m cli courses_large_simple.csv --constraints lecturer group room --strategy rlf
+    python -m cli exporte/ --out ergebnisse/ --workers 4
+
+Je CSV werden <name>_timetable.json (Ergebnis von create_timetable) und
+<name>_stundenplan.xlsx geschrieben.
+"""
+import argparse
+import os
+import sys
+from datetime import date
+
+# Schwere Module (pandas, numpy, openpyxl, ...) werden erst in den Funktionen importiert,
+# damit z.B. "python -m cli --help" sofort antwortet. matplotlib, networkx und streamlit
+# werden von diesem Einstiegspunkt überhaupt nicht geladen.
+
+STRATEGY_ALIASES = {
+    "greedy": "Greedy-Algorithmus",
+    "welsh-powell": "Welsh-Powell-Algorithmus",
+    "backtracking": "Backtracking-Algorithmus",
+    "dsatur": "DSATUR-Algorithmus",
+    "rlf": "RLF-Algorithmus",
+    "smallest-last": "Smallest-Last-Algorithmus",
+    "portfolio": "Portfolio (beste Strategie im Zeitbudget)",
+}
+
+ROOM_COLS = ["room", "Room", "Raum", "raum"]
+INSTRUCTOR_COLS = ["lecturer", "Lecturer", "Dozent", "dozent", "instructor"]
+TITLE_COLS = ["title", "Title", "Modul", "modul", "course_name", "CourseName"]
+
+
+def _pick(columns, explicit, candidates):
+    if explicit == "":
+        return None
+    if explicit is not None:
+        return explicit
+    return next((c for c in candidates if c in columns), None)
+
+
+def _to_json(result):
+    data = {
+        "k": result["k"],
+        "weeks": result["weeks"],
+        "slots": [list(s) for s in result["slots"]],
+        "colors": [int(c) for c in result["colors"]],
+        "assignment_cost": result["assignment_cost"],
+        "color_to_slot": {str(c): list(s) for c, s in result["color_to_slot"].items()},
+        "course_to_slot": {str(cid): list(s) for cid, s in result["course_to_slot"].items()},
+        "satisfied": result["satisfied"],
+        "total": result["total"],
+        "satisfaction": result["satisfaction"],
+    }
+    #### mit Kapazität können Farbklassen auf mehrere Slots verteilt sein
+    if "color_to_slots" in result:
+        data["color_to_slots"] = {str(c): [list(s) for s in slots] for c, slots in result["color_to_slots"].items()}
+    return data
+
+
+def process_file(path, out_dir, node_col, constraint_cols, strategy, sep=",", by_components=True,
+                 processes=None, time_limit=None, start_date=None, room_col=None, instructor_col=None,
+                 title_col=None, stream=False, chunksize=100_000, seed=0, restarts=1, tabu=0, days=None,
+                 halves=None, capacity=None, preferences=False, perf=False, cprofile=False):
+    """
+    Eine CSV einlesen, färben, Slots zuweisen und JSON + Excel schreiben -> Kurzbericht.
+    perf/cprofile: zusätzlich <name>_performance.json mit Laufzeiten je Abschnitt, Zählern und ggf. cProfile.
+    """
+    import json
+
+    import pandas as pd
+
+    from functions.creating_excel import export_detailed_timetable_to_excel
+    from functions.instrumentation import profiling, stage
+    from functions.pipeline import build_graph, color_graph
+    from functions.timetable_algo import create_timetable
+
+    with profiling(enabled=perf or cprofile, cprofile=cprofile) as report:
+        if stream:
+            from functions.ingest import read_catalogue_streaming
+
+            columns = pd.read_csv(path, sep=sep, nrows=0).columns
+            node_col = node_col or columns[0]
+            room_col = _pick(columns, room_col, ROOM_COLS)
+            instructor_col = _pick(columns, instructor_col, INSTRUCTOR_COLS)
+            title_col = _pick(columns, title_col, TITLE_COLS)
+            keep = [c for c in [room_col, instructor_col, title_col] if c]
+            with stage("CSV einlesen"):
+                df, graph, _ = read_catalogue_streaming(path, node_col, constraint_cols, sep=sep,
+                                                        chunksize=chunksize, keep_cols=keep)
+        else:
+            with stage("CSV einlesen"):
+                df = pd.read_csv(path, sep=sep)
+            node_col = node_col or df.columns[0]
+            missing = [c for c in [node_col, *constraint_cols] if c not in df.columns]
+            if missing:
+                raise ValueError(f"{path}: Spalten fehlen: {missing}")
+            graph, _ = build_graph(df, node_col, constraint_cols)
+
+        def satisfaction(coloring):
+            return create_timetable(df, graph, coloring, days=days, halves=halves, capacity=capacity,
+                                    node_col=node_col)["satisfaction"]
+
+        prefs = None
+        if preferences and "preferred_time" in df.columns:
+            rows = df.drop_duplicates(subset=node_col)
+            prefs = dict(zip(rows[node_col], rows["preferred_time"]))
+
+        color_dict, details = color_graph(graph, strategy, by_components=by_components, processes=processes,
+                                          time_limit=time_limit, seed=seed, restarts=restarts, score=satisfaction,
+                                          improve_time=tabu, preferences=prefs)
+        result = create_timetable(df, graph, color_dict, days=days, halves=halves, capacity=capacity,
+                                  node_col=node_col)
+
+        stem = os.path.splitext(os.path.basename(path))[0]
+        os.makedirs(out_dir, exist_ok=True)
+        json_path = os.path.join(out_dir, f"{stem}_timetable.json")
+        xlsx_path = os.path.join(out_dir, f"{stem}_stundenplan.xlsx")
+
+        payload = _to_json(result)
+        if details is not None:
+            payload["details"] = {k: v for k, v in details.items() if k != "coloring"}
+        with open(json_path, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, ensure_ascii=False, indent=2)
+
+        export_detailed_timetable_to_excel(
+            result=result,
+            dataset=df,
+            start_date=start_date or date.today().strftime("%Y-%m-%d"),
+            file_path=xlsx_path,
+            course_col=node_col,
+            room_col=_pick(df.columns, room_col, ROOM_COLS),
+            instructor_col=_pick(df.columns, instructor_col, INSTRUCTOR_COLS),
+            title_col=_pick(df.columns, title_col, TITLE_COLS),
+        )
+
+    summary = {"file": path, "courses": len(graph), "k": result["k"], "weeks": result["weeks"],
+               "satisfaction": result["satisfaction"], "json": json_path, "xlsx": xlsx_path}
+    if report is not None:
+        summary["performance"] = os.path.join(out_dir, f"{stem}_performance.json")
+        summary["total_s"] = report["total"]
+        with open(summary["performance"], "w", encoding="utf-8") as fh:
+            json.dump(report, fh, ensure_ascii=False, indent=2)
+    return summary
+
+
+def _run_one(job):
+    path, kwargs = job
+    try:
+        return process_file(path, **kwargs)
+    except Exception as e:
+        return {"file": path, "error": f"{type(e).__name__}: {e}"}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m cli", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", help="CSV-Datei oder Verzeichnis mit CSV-Dateien")
+    parser.add_argument("--out", default="ergebnisse", help="Ausgabeverzeichnis (Standard: ergebnisse)")
+    parser.add_argument("--node", default=None, help="Knoten-Spalte (Standard: erste Spalte)")
+    parser.add_argument("--constraints", nargs="+", default=["lecturer", "group", "room"],
+                        help="Constraint-Spalten (gleicher Wert => Konflikt)")
+    parser.add_argument("--strategy", default="dsatur",
+                        help=f"Färbe-Strategie: {', '.join(STRATEGY_ALIASES)} (oder Bezeichnung aus der App)")
+    parser.add_argument("--sep", default=",", help="Trennzeichen der CSV (\\t für Tab)")
+    parser.add_argument("--no-components", action="store_true",
+                        help="Graph nicht in Zusammenhangskomponenten zerlegen")
+    parser.add_argument("--time-limit", type=float, default=60.0,
+                        help="Zeitbudget Backtracking bzw. Portfolio in Sekunden")
+    parser.add_argument("--start-date", default=None, help="Startdatum für den Kalender (YYYY-MM-DD)")
+    parser.add_argument("--room-col", default=None, help="Raum-Spalte für Excel ('' = keine)")
+    parser.add_argument("--lecturer-col", default=None, help="Dozent-Spalte für Excel ('' = keine)")
+    parser.add_argument("--title-col", default=None, help="Titel-Spalte für Excel ('' = keine)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed für Greedy (reproduzierbar)")
+    parser.add_argument("--restarts", type=int, default=1, help="Greedy-Mehrfachstart: Anzahl Läufe")
+    parser.add_argument("--tabu", type=float, default=0, metavar="SEKUNDEN",
+                        help="anschließende Tabu-Suche zur Farbreduktion (0 = aus)")
+    parser.add_argument("--days", nargs="+", default=None, help="Unterrichtstage (Standard: Mo Di Mi Do Fr)")
+    parser.add_argument("--periods", nargs="+", default=None,
+                        help="Perioden je Tag wie in der Präferenz-Spalte (Standard: Morning Afternoon)")
+    parser.add_argument("--capacity", type=int, default=None,
+                        help="Kurse je Slot (z.B. Räume); konfliktfreie Farbklassen teilen sich dann Slots")
+    parser.add_argument("--preferences", action="store_true",
+                        help="Präferenzen (preferred_time) schon beim Färben berücksichtigen")
+    parser.add_argument("--perf", action="store_true",
+                        help="Laufzeiten je Abschnitt und Zähler messen (<name>_performance.json)")
+    parser.add_argument("--cprofile", action="store_true", help="wie --perf, zusätzlich mit cProfile")
+    parser.add_argument("--stream", action="store_true",
+                        help="CSV blockweise einlesen (für sehr große Exporte, nur benötigte Spalten)")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="Zeilen je Block bei --stream")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Prozesse für Verzeichnis-Batch bzw. Komponenten einer Datei")
+    args = parser.parse_args(argv)
+
+    strategy = STRATEGY_ALIASES.get(args.strategy.lower(), args.strategy)
+    if strategy not in STRATEGY_ALIASES.values():
+        parser.error(f"unbekannte Strategie: {args.strategy}")
+
+    if os.path.isdir(args.input):
+        paths = sorted(os.path.join(args.input, f) for f in os.listdir(args.input) if f.lower().endswith(".csv"))
+        if not paths:
+            parser.error(f"keine CSV-Dateien in {args.input}")
+    else:
+        paths = [args.input]
+
+    batch = len(paths) > 1 and args.workers > 1
+    kwargs = dict(
+        out_dir=args.out,
+        node_col=args.node,
+        constraint_cols=args.constraints,
+        strategy=strategy,
+        sep={"\\t": "\t"}.get(args.sep, args.sep),
+        by_components=not args.no_components,
+        # Im Batch wird über Dateien parallelisiert, nicht zusätzlich über Komponenten
+        processes=None if batch else args.workers,
+        time_limit=args.time_limit,
+        start_date=args.start_date,
+        room_col=args.room_col,
+        instructor_col=args.lecturer_col,
+        title_col=args.title_col,
+        stream=args.stream,
+        chunksize=args.chunksize,
+        seed=args.seed,
+        restarts=args.restarts,
+        tabu=args.tabu,
+        days=args.days,
+        halves=args.periods,
+        capacity=args.capacity,
+        preferences=args.preferences,
+        perf=args.perf,
+        cprofile=args.cprofile,
+    )
+    jobs = [(p, kwargs) for p in paths]
+
+    if batch:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(args.workers, len(paths))) as ex:
+            reports = list(ex.map(_run_one, jobs))
+    else:
+        reports = [_run_one(job) for job in jobs]
+
+    failed = 0
+    for r in reports:
+        if "error" in r:
+            failed += 1
+            print(f"FEHLER {r['file']}: {r['error']}", file=sys.stderr)
+        else:
+            print(f"{r['file']}: {r['courses']} Kurse, {r['k']} Farben, {r['weeks']} Wochen, "
+                  f"Score {r['satisfaction'] * 100:.1f}% -> {r['xlsx']}"
+                  + (f" ({r['total_s']:.2f} s, {r['performance']})" if "performance" in r else ""))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
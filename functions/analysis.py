@@ -1,21 +1,114 @@
+import numpy as np
+
+from algorithms.smallest_last import degeneracy_bound
+from functions.conflict_graph import as_conflict_graph
+
+#### ab dieser Dichte arbeiten DSATUR, RLF und Backtracking auf Bitmasken statt auf Mengen
+BITSET_DENSITY = 0.3
+
+
 def get_edges(adj):
-    edges = set()
-    for u, nbrs in adj.items():
-        for v in nbrs:
-            if v == u:
-                continue
-            edges.add(tuple(sorted((u, v))))
-    return len(edges)
+    return get_degree_stats(adj)["edges"]
 
 def get_highest_degree(adj):
-    hd = 0
-    for i in adj.keys():
-        if len(adj[i]) > hd:
-            hd = len(adj[i])
-    return hd
+    return get_degree_stats(adj)["max_degree"]
 
 def get_density(adj):
-    E = get_edges(adj)
-    V = len(adj.keys())
-    density = (2 * E) / (V * (V - 1))
-    return density
\ No newline at end of file
+    return get_degree_stats(adj)["density"]
+
+def use_bitset(adj, threshold=BITSET_DENSITY):
+    """Bitset-Darstellung verwenden? (Dichte nach get_density mindestens threshold)"""
+    if len(adj) < 2:
+        return False
+    return get_density(adj) >= threshold
+
+
+##############################################################################################
+#### Clique (gierig) als untere Schranke für die Farbanzahl
+def get_greedy_clique(adj, max_starts=None):
+    """
+    Sucht gierig eine möglichst große Clique: Start bei Knoten mit hohem Grad,
+    danach wird jeweils der Kandidat mit dem höchsten Grad hinzugefügt.
+    Jede Färbung braucht mindestens len(Clique) Farben.
+
+    -> Liste der Knoten der gefundenen Clique
+    """
+    graph = as_conflict_graph(adj)
+    nbrs = graph.nbrs
+    deg = [len(nb) for nb in nbrs]
+    order = sorted(range(len(nbrs)), key=lambda i: -deg[i])
+    if max_starts is not None:
+        order = order[:max_starts]
+
+    best = []
+    for v in order:
+        if deg[v] + 1 <= len(best):
+            break
+        clique = [v]
+        cand = nbrs[v]
+        while cand and len(clique) + len(cand) > len(best):
+            u = max(cand, key=lambda x: (deg[x], -x))
+            clique.append(u)
+            cand = cand & nbrs[u]
+        if len(clique) > len(best):
+            best = clique
+
+    return [graph.nodes[i] for i in best]
+
+
+##############################################################################################
+#### Kennzahlen in einem Durchlauf, am ConflictGraph gemerkt
+def _degree_stats(graph):
+    deg = graph.degrees()
+    V = len(deg)
+    E = int(deg.sum()) // 2
+    return {
+        "nodes": V,
+        "edges": E,
+        "max_degree": int(deg.max()) if V else 0,
+        "density": (2 * E) / (V * (V - 1)) if V > 1 else 0.0,
+        "degree_histogram": np.bincount(deg).tolist() if V else [],
+    }
+
+
+def _count_components(graph):
+    nbrs = graph.nbrs
+    seen = [False] * len(nbrs)
+    count = 0
+    for s in range(len(nbrs)):
+        if seen[s]:
+            continue
+        count += 1
+        seen[s] = True
+        stack = [s]
+        while stack:
+            for u in nbrs[stack.pop()]:
+                if not seen[u]:
+                    seen[u] = True
+                    stack.append(u)
+    return count
+
+
+def _graph_stats(graph):
+    stats = dict(get_degree_stats(graph))
+    stats["components"] = _count_components(graph)
+    stats["clique_lower_bound"] = len(get_greedy_clique(graph))
+    stats["degeneracy_upper_bound"] = degeneracy_bound(graph)
+    return stats
+
+
+def get_degree_stats(adj):
+    """
+    Knoten, Kanten, maximaler Grad, Dichte und Gradverteilung (degree_histogram[d] = Anzahl Knoten
+    mit Grad d) aus den Gradsummen. Bei einem ConflictGraph wird das Ergebnis am Graphen gemerkt.
+    """
+    return as_conflict_graph(adj).cached("degree_stats", _degree_stats)
+
+
+def get_graph_stats(adj):
+    """
+    Alle Kennzahlen für das Analyse-Panel: get_degree_stats plus Anzahl Zusammenhangskomponenten
+    und Clique-Größe bzw. Degeneriertheit + 1 als untere bzw. obere Schranke für die Farbanzahl
+    (am ConflictGraph gemerkt).
+    """
+    return as_conflict_graph(adj).cached("stats", _graph_stats)
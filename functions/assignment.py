@@ -0,0 +1,94 @@
+import numpy as np
+
+from functions.instrumentation import count
+
+
+##############################################################################################
+#### Lineares Zuordnungsproblem (Shortest-Augmenting-Path, Jonker-Volgenant / Crouse)
+def linear_sum_assignment(cost_matrix, maximize=False):
+    """
+    Löst das lineare Zuordnungsproblem mit kürzesten augmentierenden Pfaden in O(n² m).
+    Gleiche Signatur und Rückgabe wie scipy.optimize.linear_sum_assignment:
+    -> (row_ind, col_ind) als np.ndarray, row_ind aufsteigend sortiert.
+
+    - cost_matrix: 2D-Array, rechteckig erlaubt (kein Auffüllen auf quadratisch),
+      np.inf markiert verbotene Zuordnungen
+    - maximize: True -> maximale statt minimale Gesamtkosten
+    """
+    C = np.asarray(cost_matrix, dtype=float)
+    if C.ndim != 2:
+        raise ValueError(f"Kostenmatrix muss zweidimensional sein, nicht {C.ndim}-dimensional")
+    if np.isnan(C).any():
+        raise ValueError("Kostenmatrix enthält NaN")
+    if maximize:
+        C = -C
+    if np.isneginf(C).any():
+        raise ValueError("Kostenmatrix enthält -inf")
+
+    transposed = C.shape[1] < C.shape[0]
+    if transposed:
+        C = C.T
+
+    n_rows, n_cols = C.shape
+    if n_rows == 0:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+
+    steps = 0
+    u = np.zeros(n_rows)
+    v = np.zeros(n_cols)
+    col4row = np.full(n_rows, -1, dtype=np.int64)
+    row4col = np.full(n_cols, -1, dtype=np.int64)
+
+    for cur_row in range(n_rows):
+        shortest = np.full(n_cols, np.inf)
+        path = np.full(n_cols, -1, dtype=np.int64)
+        visited_cols = np.zeros(n_cols, dtype=bool)
+        visited_rows = []
+
+        i = cur_row
+        min_val = 0.0
+        sink = -1
+        while sink == -1:
+            steps += 1
+            visited_rows.append(i)
+            # reduzierte Kosten über alle Spalten auf einmal
+            reduced = min_val + C[i] - u[i] - v
+            better = ~visited_cols & (reduced < shortest)
+            path[better] = i
+            shortest[better] = reduced[better]
+
+            open_cols = np.flatnonzero(~visited_cols)
+            lowest = shortest[open_cols].min()
+            if lowest == np.inf:
+                raise ValueError("Kostenmatrix ist nicht lösbar (keine zulässige Zuordnung)")
+            ties = open_cols[shortest[open_cols] == lowest]
+            free = ties[row4col[ties] == -1]
+            j = int(free[0]) if len(free) else int(ties[0])
+
+            min_val = lowest
+            visited_cols[j] = True
+            if row4col[j] == -1:
+                sink = j
+            else:
+                i = int(row4col[j])
+
+        # Duale Variablen anpassen
+        u[cur_row] += min_val
+        for r in visited_rows[1:]:
+            u[r] += min_val - shortest[col4row[r]]
+        v[visited_cols] -= min_val - shortest[visited_cols]
+
+        # Augmentieren entlang des Pfades
+        j = sink
+        while True:
+            i = int(path[j])
+            row4col[j] = i
+            col4row[i], j = j, col4row[i]
+            if i == cur_row:
+                break
+
+    count("Zuordnungs-Iterationen", steps)
+    if transposed:
+        order = np.argsort(col4row)
+        return col4row[order], order
+    return np.arange(n_rows), col4row
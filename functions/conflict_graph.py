@@ -0,0 +1,199 @@
+from collections.abc import Mapping
+
+import numpy as np
+
+
+class ConflictGraph(Mapping):
+    """
+    Konfliktgraph mit fortlaufend nummerierten Knoten.
+
+    - nodes[i]  -> ursprüngliche Knoten-ID (z.B. course_id) des Knotens i
+    - index[id] -> Nummer i des Knotens
+    - nbrs[i]   -> set der Nachbar-Nummern von i (ohne Schleifen, ohne Duplikate)
+
+    Nach außen verhält sich der Graph wie das bisherige Adjazenz-Dictionary
+    (graph[id] -> Nachbar-IDs, graph.keys(), graph.items(), len(graph)),
+    daher kann er direkt an alle Algorithmen in algorithms/ übergeben werden.
+    """
+
+    def __init__(self, nodes=()):
+        self.nodes = []
+        self.index = {}
+        self.nbrs = []
+        self._cache = {}
+        for node in nodes:
+            self.add_node(node)
+
+    ##############################################################################################
+    #### Aufbau
+    def add_node(self, node):
+        i = self.index.get(node)
+        if i is None:
+            i = len(self.nodes)
+            self.index[node] = i
+            self.nodes.append(node)
+            self.nbrs.append(set())
+            self._cache.clear()
+        return i
+
+    def add_edge(self, u, v):
+        i = self.add_node(u)
+        j = self.add_node(v)
+        if i != j:
+            self.nbrs[i].add(j)
+            self.nbrs[j].add(i)
+            self._cache.clear()
+
+    def add_clique(self, members):
+        self.add_clique_indices([self.add_node(m) for m in members])
+
+    def add_clique_indices(self, idx):
+        idx = list(set(idx))
+        if len(idx) < 2:
+            return
+        for i in idx:
+            nb = self.nbrs[i]
+            nb.update(idx)
+            nb.discard(i)
+        self._cache.clear()
+
+    def remove_edges(self, i):
+        """Alle Kanten des Knotens i entfernen (Knoten bleibt erhalten)."""
+        for j in self.nbrs[i]:
+            self.nbrs[j].discard(i)
+        self.nbrs[i] = set()
+        self._cache.clear()
+
+    def remove_node(self, node):
+        """Knoten entfernen; der bisher letzte Knoten übernimmt dessen Nummer."""
+        i = self.index[node]
+        self.remove_edges(i)
+        last = len(self.nodes) - 1
+        if i != last:
+            moved = self.nodes[last]
+            self.nodes[i] = moved
+            self.index[moved] = i
+            self.nbrs[i] = self.nbrs[last]
+            for j in self.nbrs[i]:
+                self.nbrs[j].discard(last)
+                self.nbrs[j].add(i)
+        del self.index[node]
+        self.nodes.pop()
+        self.nbrs.pop()
+        self._cache.clear()
+
+    @classmethod
+    def from_adjazenz(cls, adjazenz):
+        """Aus dem bisherigen Dictionary {Knoten: [Nachbarn]} erzeugen (Kanten werden symmetrisch)."""
+        graph = cls(adjazenz.keys())
+        for u, nbs in adjazenz.items():
+            for v in nbs:
+                graph.add_edge(u, v)
+        return graph
+
+    ##############################################################################################
+    #### Abfragen
+    def degree(self, i):
+        return len(self.nbrs[i])
+
+    def degrees(self):
+        return np.fromiter((len(nb) for nb in self.nbrs), dtype=np.int64, count=len(self.nbrs))
+
+    def number_of_edges(self):
+        return sum(len(nb) for nb in self.nbrs) // 2
+
+    def cached(self, key, compute):
+        """Abgeleitete Größe compute(self) merken, bis der Graph das nächste Mal verändert wird."""
+        if key not in self._cache:
+            self._cache[key] = compute(self)
+        return self._cache[key]
+
+    def to_csr(self):
+        """
+        Kompakte CSR-Darstellung (sortierte Nachbarn).
+        -> (indptr, indices): Nachbarn von i sind indices[indptr[i]:indptr[i + 1]]
+        """
+        if "csr" not in self._cache:
+            indptr = np.zeros(len(self.nbrs) + 1, dtype=np.int64)
+            np.cumsum([len(nb) for nb in self.nbrs], out=indptr[1:])
+            indices = np.fromiter((j for nb in self.nbrs for j in sorted(nb)),
+                                  dtype=np.int64, count=int(indptr[-1]))
+            self._cache["csr"] = (indptr, indices)
+        return self._cache["csr"]
+
+    def to_bitsets(self):
+        """
+        Bitset-Darstellung für dichte Graphen: Bit j von bits[i] ist gesetzt, wenn j Nachbar von i ist.
+        -> Liste von Python-int (eine Bitmaske je Knoten)
+        """
+        if "bits" not in self._cache:
+            n = len(self.nbrs)
+            indptr, indices = self.to_csr()
+            row = np.zeros(n, dtype=bool)
+            bits = []
+            for i in range(n):
+                nb = indices[indptr[i]:indptr[i + 1]]
+                row[nb] = True
+                bits.append(int.from_bytes(np.packbits(row, bitorder="little").tobytes(), "little"))
+                row[nb] = False
+            self._cache["bits"] = bits
+        return self._cache["bits"]
+
+    def subgraph(self, indices):
+        """Induzierter Teilgraph über die Knotennummern indices (neu ab 0 nummeriert)."""
+        indices = list(indices)
+        sub = ConflictGraph()
+        sub.nodes = [self.nodes[i] for i in indices]
+        sub.index = {node: j for j, node in enumerate(sub.nodes)}
+        local = {i: j for j, i in enumerate(indices)}
+        sub.nbrs = [{local[u] for u in self.nbrs[i] if u in local} for i in indices]
+        return sub
+
+    def copy(self):
+        """Unabhängige Kopie (z.B. vor einer Änderung eines zwischengespeicherten Graphen)."""
+        return self.subgraph(range(len(self.nodes)))
+
+    def to_adjazenz(self):
+        """Rückwärtskompatibles Dictionary {Knoten: [Nachbarn]}."""
+        return {self.nodes[i]: [self.nodes[j] for j in sorted(nb)] for i, nb in enumerate(self.nbrs)}
+
+    def coloring_from_indices(self, colors):
+        """Farbliste/-array über Knotennummern -> Dictionary {Knoten: Farbe}."""
+        return {self.nodes[i]: int(c) for i, c in enumerate(colors)}
+
+    ##############################################################################################
+    #### Mapping-Schnittstelle (wie das Adjazenz-Dictionary)
+    def __getitem__(self, node):
+        labels = self._cache.setdefault("labels", {})
+        nb = labels.get(node)
+        if nb is None:
+            nb = frozenset(self.nodes[j] for j in self.nbrs[self.index[node]])
+            labels[node] = nb
+        return nb
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, node):
+        return node in self.index
+
+    def __repr__(self):
+        return f"ConflictGraph(nodes={len(self.nodes)}, edges={self.number_of_edges()})"
+
+
+def iter_bits(mask):
+    """Nummern der gesetzten Bits einer Bitmaske (aufsteigend)."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def as_conflict_graph(adjazenz):
+    """ConflictGraph unverändert zurückgeben, Dictionary-Adjazenzen umwandeln."""
+    if isinstance(adjazenz, ConflictGraph):
+        return adjazenz
+    return ConflictGraph.from_adjazenz(adjazenz)
@@ -1,32 +1,90 @@
-def create_adjazenz_list_per_constraint(datensatz, index_node, index_constraint):
-    array = datensatz.to_numpy()
-    edges = {}
+import pandas as pd
+
+from functions.conflict_graph import ConflictGraph
+from functions.instrumentation import timed
+
 
-    length = len(array)
-    for i in range(length):
-        for t in range(length):
-            if t == i:
-                continue
-            elif array[t][index_constraint] == array[i][index_constraint]:
-                if array[i][index_node] in edges:
-                    edges[array[i][index_node]].append(array[t][index_node])
-                else:
-                    edges[array[i][index_node]] = []
-                    edges[array[i][index_node]].append(array[t][index_node])
+##############################################################################################
+#### Zeilen je Constraint-Wert gruppieren (statt paarweisem Vergleich aller Zeilen)
+def _group_rows(codes):
+    rows_per_code = {}
+    for row, code in enumerate(codes.tolist()):
+        if code < 0:
+            continue
+        if code in rows_per_code:
+            rows_per_code[code].append(row)
+        else:
+            rows_per_code[code] = [row]
+    return rows_per_code
 
+
+def _adjazenz_from_codes(nodes, codes):
+    rows_per_code = _group_rows(codes)
+
+    edges = {}
+    for i, code in enumerate(codes.tolist()):
+        if code < 0:
+            continue
+        bucket = rows_per_code[code]
+        if len(bucket) < 2:
+            continue
+        node = nodes[i]
+        if node not in edges:
+            edges[node] = []
+        edges[node].extend(nodes[t] for t in bucket if t != i)
     return edges
 
 
+@timed("Adjazenz je Constraint")
+def create_adjazenz_list_per_constraint(datensatz, index_node, index_constraint):
+    nodes = datensatz.iloc[:, index_node].tolist()
+    codes, _ = pd.factorize(datensatz.iloc[:, index_constraint], use_na_sentinel=True)
+    return _adjazenz_from_codes(nodes, codes)
+
+
+##############################################################################################
+#### Konfliktgraph direkt aus den Buckets aller Constraint-Spalten aufbauen
+@timed("Konfliktgraph")
+def build_conflict_graph(datensatz, index_node, index_constraints):
+    """
+    Erzeugt einen ConflictGraph über alle Knoten des Datensatzes
+    (auch Knoten ohne Konflikte) und verbindet jeden Bucket als Clique.
+
+    -> (ConflictGraph, {Spaltenname: Anzahl Konfliktpaare})
+    """
+    nodes = datensatz.iloc[:, index_node].tolist()
+    graph = ConflictGraph(nodes)
+    node_idx = [graph.index[n] for n in nodes]
+    edge_counts = {}
+    for index_constraint in index_constraints:
+        codes, _ = pd.factorize(datensatz.iloc[:, index_constraint], use_na_sentinel=True)
+        rows_per_code = _group_rows(codes)
+        n_pairs = 0
+        for rows in rows_per_code.values():
+            if len(rows) > 1:
+                graph.add_clique_indices([node_idx[r] for r in rows])
+                n_pairs += len(rows) * (len(rows) - 1) // 2
+        edge_counts[datensatz.columns[index_constraint]] = n_pairs
+
+    return graph, edge_counts
+
+
+@timed("Constraints verbinden")
 def connect_all_constraints(*dicts):
     all_edges = {}
+    seen = {}
 
     for G in dicts:
         for n, e in G.items():
             if n not in all_edges:
                 all_edges[n] = []
+                seen[n] = set()
 
+            nbrs = all_edges[n]
+            nbrs_seen = seen[n]
             for i in e:
-                if i not in all_edges[n]:
-                    all_edges[n].append(i)
+                if i not in nbrs_seen:
+                    nbrs_seen.add(i)
+                    nbrs.append(i)
 
-    return all_edges
\ No newline at end of file
+    return all_edges
@@ -2,7 +2,10 @@ from datetime import datetime, timedelta
 from io import BytesIO
 import pandas as pd
 
+from functions.instrumentation import timed
 
+
+@timed("Excel-Export")
 def export_detailed_timetable_to_excel(
         result: dict,
         dataset: pd.DataFrame,
@@ -12,7 +15,8 @@ def export_detailed_timetable_to_excel(
         room_col: str = "room",  # z.B. "Raum"
         instructor_col: str = "lecturer",  # z.B. "Dozent"
         title_col: str | None = None,  # z.B. "title" oder "modul"
-        use_german_headers: bool = True
+        use_german_headers: bool = True,
+        engine: str = "xlsxwriter"  # "openpyxl" = bisheriger Weg mit Zellformatierung je Zelle
 ):
     # --- Prüfen, ob notwendige Spalten existieren ---
     required = [course_col]
@@ -32,13 +36,17 @@ def export_detailed_timetable_to_excel(
     dt = datetime.strptime(start_date, "%Y-%m-%d").date()
     monday0 = dt - timedelta(days=dt.weekday())
 
-    # --- Tages-/Beschriftungen ---
-    day_order = ["Mo", "Di", "Mi", "Do", "Fr"]
+    # --- Tages-/Beschriftungen (Tage und Perioden aus dem Slotmodell des Ergebnisses) ---
+    slots = result.get("slots") or [(1, d, h) for d in ["Mo", "Di", "Mi", "Do", "Fr"] for h in ["Morning", "Afternoon"]]
+    day_order = list(dict.fromkeys(s[1] for s in slots))
+    half_order = list(dict.fromkeys(s[2] for s in slots))
     if use_german_headers:
-        day_name = {"Mo": "Montag", "Di": "Dienstag", "Mi": "Mittwoch", "Do": "Donnerstag", "Fr": "Freitag"}
+        day_name = {"Mo": "Montag", "Di": "Dienstag", "Mi": "Mittwoch", "Do": "Donnerstag", "Fr": "Freitag",
+                    "Sa": "Samstag", "So": "Sonntag"}
     else:
-        day_name = {"Mo": "Monday", "Di": "Tuesday", "Mi": "Wednesday", "Do": "Thursday", "Fr": "Friday"}
-    half_order = ["Morning", "Afternoon"]
+        day_name = {"Mo": "Monday", "Di": "Tuesday", "Mi": "Wednesday", "Do": "Thursday", "Fr": "Friday",
+                    "Sa": "Saturday", "So": "Sunday"}
+    weekday = {"Mo": 0, "Di": 1, "Mi": 2, "Do": 3, "Fr": 4, "Sa": 5, "So": 6}
 
     # --- Datensatz schlank mappen: course_id -> (Titel, Raum, Dozent)
     # Falls Mehrfachzeilen je Kurs existieren, nimm die erste (oder aggregiere nach Bedarf).
@@ -46,13 +54,23 @@ def export_detailed_timetable_to_excel(
     for col in [title_col, room_col, instructor_col]:
         if col and col not in cols_to_take:
             cols_to_take.append(col)
-    slim = dataset[cols_to_take].drop_duplicates(subset=[course_col]).set_index(course_col)
+    slim = dataset[cols_to_take].drop_duplicates(subset=[course_col])
+
+    # einmal vorab als Dictionary statt einer Series-Suche je Kurs und Feld
+    def column_lookup(col):
+        if not col or col == course_col or col not in slim.columns:
+            return {}
+        return dict(zip(slim[course_col].tolist(), slim[col].tolist()))
 
-    def format_entry(cid: str):
+    titles = column_lookup(title_col)
+    rooms = column_lookup(room_col)
+    instructors = column_lookup(instructor_col)
+
+    def format_entry(cid):
         # hole Felder (mit Fallback auf "")
-        title = slim[title_col].get(cid, "") if title_col else ""
-        room = slim[room_col].get(cid, "") if room_col in slim.columns else ""
-        inst = slim[instructor_col].get(cid, "") if instructor_col in slim.columns else ""
+        title = titles.get(cid, "")
+        room = rooms.get(cid, "")
+        inst = instructors.get(cid, "")
         parts = []
         # Kurs-ID immer zeigen
         parts.append(str(cid) if not title else f"{cid} — {title}")
@@ -69,8 +87,78 @@ def export_detailed_timetable_to_excel(
     # füllen
     for cid, (w, d, h) in course_to_slot.items():
         if w in per_week and (d, h) in per_week[w]:
-            per_week[w][(d, h)].append(format_entry(str(cid)))
+            per_week[w][(d, h)].append(format_entry(cid))
+
+    summary = [("Startdatum (Woche 1, Montag)", monday0.strftime("%d.%m.%Y")), ("Wochen", weeks),
+               ("Kurse gesamt", len(course_to_slot))]
+    dates = {w: [(monday0 + timedelta(days=7 * (w - 1) + weekday.get(d, i))).strftime("%d.%m.%Y")
+                 for i, d in enumerate(day_order)] for w in range(1, weeks + 1)}
+    layout = (weeks, day_order, half_order, [day_name.get(d, d) for d in day_order], per_week, dates, summary)
+
+    if engine == "openpyxl":
+        return _write_openpyxl(file_path, *layout)
+    return _write_xlsxwriter(file_path, *layout)
+
+
+##############################################################################################
+#### xlsxwriter: Formate einmal anlegen, Zeilen streng nacheinander schreiben (constant_memory)
+def _write_xlsxwriter(file_path, weeks, day_order, half_order, day_labels, per_week, dates, summary):
+    import xlsxwriter
+
+    out = None
+    if file_path is None:
+        out = BytesIO()
+    wb = xlsxwriter.Workbook(out if out is not None else file_path, {"constant_memory": True})
+
+    thin = {"border": 1}
+    fmt_head = wb.add_format({**thin, "bg_color": "#C8102E", "font_color": "#FFFFFF", "bold": True,
+                              "font_size": 12, "align": "center", "valign": "vcenter", "text_wrap": True})
+    fmt_half = wb.add_format({**thin, "bg_color": "#F2F2F2", "font_color": "#000000", "bold": True,
+                              "align": "center", "valign": "vcenter", "text_wrap": True})
+    fmt_cell = wb.add_format({**thin, "align": "center", "valign": "vcenter", "text_wrap": True})
+    fmt_bold = wb.add_format({"bold": True})
+
+    # --- Übersicht ---
+    ws_sum = wb.add_worksheet("Übersicht")
+    ws_sum.set_column(0, 0, 32)
+    ws_sum.set_column(1, 1, 22)
+    ws_sum.write(0, 0, "Kennzahl", fmt_bold)
+    ws_sum.write(0, 1, "Wert")
+    for r, (key, value) in enumerate(summary, start=1):
+        ws_sum.write(r, 0, key)
+        ws_sum.write(r, 1, value)
+
+    # --- Wochenblätter ---
+    for w in range(1, weeks + 1):
+        ws = wb.add_worksheet(f"Woche {w}")
+        ws.set_column(0, 0, 16)  # Slot
+        ws.set_column(1, len(day_order), 36)
+        ws.set_row(0, 26)
+        ws.set_row(1, 20)
+        for r in range(2, 2 + len(half_order)):
+            ws.set_row(r, 90)
+
+        # Kopfzeile: Tage, dann "Slot" über zwei Zeilen, dann Datum (Zeilenreihenfolge für constant_memory)
+        ws.write_row(0, 1, day_labels, fmt_head)
+        ws.merge_range(0, 0, 1, 0, "Slot", fmt_head)
+        ws.write_row(1, 1, dates[w], fmt_head)
+
+        for r, half in enumerate(half_order, start=2):
+            ws.write_string(r, 0, half, fmt_half)
+            for i, d in enumerate(day_order):
+                ws.write_string(r, 1 + i, "\n".join(per_week[w][(d, half)]), fmt_cell)
+
+    wb.close()
+
+    if out is not None:
+        out.seek(0)
+        return out.getvalue()
+    return None
+
 
+##############################################################################################
+#### openpyxl: bisheriger Weg
+def _write_openpyxl(file_path, weeks, day_order, half_order, day_labels, per_week, dates, summary):
     # --- Excel schreiben (openpyxl-Engine, keine zusätzliche Lib nötig) ---
     out = None
     if file_path is None:
@@ -83,6 +171,7 @@ def export_detailed_timetable_to_excel(
 
     # Stile (openpyxl)
     from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+    from openpyxl.utils import get_column_letter
     border = Border(left=Side(style="thin"), right=Side(style="thin"),
                     top=Side(style="thin"), bottom=Side(style="thin"))
     fill_head = PatternFill("solid", fgColor="C8102E")  # DHBW-Rot
@@ -93,8 +182,8 @@ def export_detailed_timetable_to_excel(
 
     # --- Übersicht ---
     summary_df = pd.DataFrame({
-        "Kennzahl": ["Startdatum (Woche 1, Montag)", "Wochen", "Kurse gesamt"],
-        "Wert": [monday0.strftime("%d.%m.%Y"), weeks, len(course_to_slot)]
+        "Kennzahl": [key for key, _ in summary],
+        "Wert": [value for _, value in summary]
     })
     summary_df.to_excel(writer, index=False, sheet_name="Übersicht")
     ws_sum = writer.sheets["Übersicht"]
@@ -113,8 +202,8 @@ def export_detailed_timetable_to_excel(
 
         # Spaltenbreiten
         ws.column_dimensions["A"].width = 16  # Slot
-        for col_letter in ["B", "C", "D", "E", "F"]:
-            ws.column_dimensions[col_letter].width = 36
+        for i in range(len(day_order)):
+            ws.column_dimensions[get_column_letter(2 + i)].width = 36
 
         # Kopfzeile: Slot + Tage + Datum
         ws.merge_cells(start_row=1, start_column=1, end_row=2, end_column=1)
@@ -124,24 +213,22 @@ def export_detailed_timetable_to_excel(
         cell.alignment = align_center
         cell.border = border
 
-        week_monday = monday0 + timedelta(days=7 * (w - 1))
         # Zeile 1: Tagesnamen, Zeile 2: Datum
         for i, d in enumerate(day_order):
             col = 2 + i
-            c1 = ws.cell(row=1, column=col, value=day_name[d])
+            c1 = ws.cell(row=1, column=col, value=day_labels[i])
             c1.fill = fill_head
             c1.font = font_white_bold
             c1.alignment = align_center
             c1.border = border
 
-            the_date = (week_monday + timedelta(days=i)).strftime("%d.%m.%Y")
-            c2 = ws.cell(row=2, column=col, value=the_date)
+            c2 = ws.cell(row=2, column=col, value=dates[w][i])
             c2.fill = fill_head
             c2.font = font_white_bold
             c2.alignment = align_center
             c2.border = border
 
-        # Zeilenbeschriftungen Morning/Afternoon
+        # Zeilenbeschriftungen (Perioden)
         for r, half in enumerate(half_order, start=3):
             c = ws.cell(row=r, column=1, value=half)
             c.fill = fill_half
@@ -149,28 +236,21 @@ def export_detailed_timetable_to_excel(
             c.alignment = align_center
             c.border = border
 
-        # Zellen mit Kurslisten füllen
+        # Zellen mit Kurslisten füllen (eine Zeile je Periode)
         for i, d in enumerate(day_order):
             col = 2 + i
-            # Morning
-            entries_m = per_week[w][(d, "Morning")]
-            text_m = "\n".join(entries_m) if entries_m else ""
-            cm = ws.cell(row=3, column=col, value=text_m)
-            cm.alignment = align_center
-            cm.border = border
-
-            # Afternoon
-            entries_a = per_week[w][(d, "Afternoon")]
-            text_a = "\n".join(entries_a) if entries_a else ""
-            ca = ws.cell(row=4, column=col, value=text_a)
-            ca.alignment = align_center
-            ca.border = border
+            for r, half in enumerate(half_order, start=3):
+                entries = per_week[w][(d, half)]
+                text = "\n".join(entries) if entries else ""
+                ce = ws.cell(row=r, column=col, value=text)
+                ce.alignment = align_center
+                ce.border = border
 
         # Zeilenhöhen (mehr Platz)
         ws.row_dimensions[1].height = 26
         ws.row_dimensions[2].height = 20
-        ws.row_dimensions[3].height = 90
-        ws.row_dimensions[4].height = 90
+        for r in range(3, 3 + len(half_order)):
+            ws.row_dimensions[r].height = 90
 
     writer.close()
 
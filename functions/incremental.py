@@ -0,0 +1,241 @@
+from collections import Counter
+
+import numpy as np
+
+from functions.assignment import linear_sum_assignment
+from functions.instrumentation import timed
+from functions.timetable_algo import create_cost_matrix, get_weeks, making_time_slots, preferences_per_color
+
+
+##############################################################################################
+#### Zeilenweiser Unterschied zweier Kurskataloge
+def diff_datasets(old, new, node_col="course_id", columns=None):
+    """
+    Vergleicht zwei Kataloge über die Knoten-Spalte (bei Mehrfachzeilen zählt die erste Zeile).
+
+    - columns: verglichene Spalten (Standard: alle Spalten, die in beiden Katalogen vorkommen)
+
+    -> {"added": [...], "removed": [...], "changed": [...]} mit Knoten-IDs
+    """
+    old_rows = old.drop_duplicates(subset=node_col).set_index(node_col)
+    new_rows = new.drop_duplicates(subset=node_col).set_index(node_col)
+    if columns is None:
+        columns = [c for c in new_rows.columns if c in old_rows.columns]
+
+    common = new_rows.index.intersection(old_rows.index, sort=False)
+    a = old_rows.loc[common, columns]
+    b = new_rows.loc[common, columns]
+    same = ((a == b) | (a.isna() & b.isna())).all(axis=1).to_numpy()
+
+    return {
+        "added": new_rows.index.difference(old_rows.index, sort=False).tolist(),
+        "removed": old_rows.index.difference(new_rows.index, sort=False).tolist(),
+        "changed": common[~same].tolist(),
+    }
+
+
+##############################################################################################
+#### Nur die betroffenen Adjazenzen anpassen
+def update_conflict_graph(graph, dataset, diff, node_col, constraint_cols):
+    """
+    Passt den ConflictGraph des alten Katalogs an Ort und Stelle an den neuen Katalog an.
+    Kanten hängen nur von den beiden beteiligten Zeilen ab, daher werden ausschließlich die Kanten
+    der hinzugefügten, entfernten und geänderten Knoten neu bestimmt.
+
+    -> Liste der neu verbundenen Knoten (hinzugefügt + geändert)
+    """
+    for node in diff["removed"]:
+        if node in graph:
+            graph.remove_node(node)
+    for node in diff["changed"]:
+        if node in graph:
+            graph.remove_edges(graph.index[node])
+    for node in diff["added"]:
+        graph.add_node(node)
+
+    touched = list(diff["added"]) + list(diff["changed"])
+    if not touched:
+        return touched
+    touched_set = set(touched)
+
+    is_touched = dataset[node_col].isin(touched_set).to_numpy()
+    for col in constraint_cols:
+        values = dataset[col]
+        #### nur Buckets mit mindestens einem betroffenen Knoten (NaN erzeugt keine Konflikte)
+        wanted = values[is_touched].dropna().unique()
+        rows = dataset.loc[values.isin(wanted).to_numpy(), [node_col, col]]
+        for _, members in rows.groupby(col, sort=False)[node_col]:
+            members = members.tolist()
+            for t in members:
+                if t not in touched_set:
+                    continue
+                for m in members:
+                    if m != t:
+                        graph.add_edge(t, m)
+
+    return touched
+
+
+##############################################################################################
+#### Lokale Reparatur der Färbung
+def _repair_coloring(graph, color, pending, preferred, color_to_slot):
+    """
+    Färbt die Knoten in pending (Farbe -1) nach, alle anderen Farben bleiben fest.
+    Reihenfolge: höchster Grad zuerst. Bevorzugt wird eine vorhandene freie Farbe, deren Slot zur
+    Präferenz passt; ist keine frei, darf ein einzelner blockierender Nachbar in eine andere
+    vorhandene Farbe ausweichen; erst dann wird eine neue Farbe eröffnet.
+
+    -> Menge der Nachbarn, die dafür umgefärbt wurden
+    """
+    nbrs = graph.nbrs
+    palette = sorted({c for c in color if c >= 0})
+    shifted = set()
+
+    for v in sorted(pending, key=lambda i: (-len(nbrs[i]), i)):
+        used = {color[u] for u in nbrs[v] if color[u] >= 0}
+        free = [c for c in palette if c not in used]
+        if free:
+            pref = preferred.get(graph.nodes[v])
+            c = next((c for c in free if c in color_to_slot and color_to_slot[c][2] == pref), free[0])
+            color[v] = c
+            continue
+
+        c = None
+        for cand in palette:
+            holders = [u for u in nbrs[v] if color[u] == cand]
+            if len(holders) != 1:
+                continue
+            u = holders[0]
+            blocked = {color[w] for w in nbrs[u]}
+            alt = next((a for a in palette if a != cand and a not in blocked), None)
+            if alt is not None:
+                color[u] = alt
+                shifted.add(u)
+                c = cand
+                break
+        if c is None:
+            c = palette[-1] + 1 if palette else 0
+            palette.append(c)
+        color[v] = c
+
+    return shifted
+
+
+##############################################################################################
+#### Inkrementelle Neuplanung
+@timed("Inkrementelle Neuplanung")
+def recolor_incremental(graph, dataset, diff, previous_coloring, previous_result, node_col="course_id",
+                        constraint_cols=(), preferred_col="preferred_time"):
+    """
+    Plant nach kleinen Katalogänderungen neu, ohne den Stundenplan umzuwerfen.
+
+    - graph: ConflictGraph des vorherigen Katalogs, wird an Ort und Stelle aktualisiert
+    - dataset: neuer Katalog, diff: Ergebnis von diff_datasets(alt, neu)
+    - previous_coloring / previous_result: bisherige Färbung und Ergebnis von create_timetable
+
+    Nur hinzugefügte und geänderte Kurse mit Konflikt werden umgefärbt. Farbklassen, deren
+    Mitglieder gleich geblieben sind, behalten ihren Slot; nur die geänderten Klassen werden neu
+    auf die freien Slots verteilt (zuerst möglichst wenige verschobene Kurse, dann Präferenzen).
+
+    Nur für das Standard-Slotmodell (eine Farbklasse je Slot).
+
+    -> Dictionary mit neuer Färbung, Ergebnis im Format von create_timetable und Anzahl
+       verschobener Kurse
+    """
+    if "groups" in previous_result:
+        raise ValueError("Inkrementelle Neuplanung nur für das Standard-Slotmodell (ohne Kapazität/eigene Slots)")
+    update_conflict_graph(graph, dataset, diff, node_col, constraint_cols)
+    nodes = graph.nodes
+    nbrs = graph.nbrs
+    index = graph.index
+
+    color = [previous_coloring.get(v, -1) for v in nodes]
+    #### Konflikte können nur an geänderten Knoten entstehen: dort die Farbe freigeben
+    for node in diff["changed"]:
+        v = index.get(node)
+        if v is not None and any(color[u] == color[v] for u in nbrs[v]):
+            color[v] = -1
+    pending = [v for v in range(len(nodes)) if color[v] < 0]
+
+    old_slots = previous_result["color_to_slot"]
+    pending_nodes = [nodes[v] for v in pending]
+    rows = dataset.drop_duplicates(subset=node_col).set_index(node_col)[preferred_col]
+    preferred = dict(zip(pending_nodes, rows.reindex(pending_nodes).tolist()))
+    shifted = _repair_coloring(graph, color, pending, preferred, old_slots)
+
+    coloring = graph.coloring_from_indices(color)
+    colors = sorted(set(coloring.values()))
+
+    #### Farbklassen mit unveränderten Mitgliedern behalten ihren Slot
+    old_members = {}
+    for node, c in previous_coloring.items():
+        old_members.setdefault(c, set()).add(node)
+    members = {}
+    for node, c in coloring.items():
+        members.setdefault(c, set()).add(node)
+    fixed = {c: old_slots[c] for c in colors if c in old_slots and members[c] == old_members.get(c)}
+    changed_colors = [c for c in colors if c not in fixed]
+
+    W = max([get_weeks(len(colors))] + [s[0] for s in fixed.values()])
+    slots = making_time_slots(W)
+    taken = set(fixed.values())
+    free_slots = [s for s in slots if s not in taken]
+
+    color_to_slot = dict(fixed)
+    if changed_colors:
+        #### Kosten: verschobene Kurse (dominierend) + verletzte Präferenzen
+        old_course_slot = previous_result["course_to_slot"]
+        big = len(coloring) + 1
+        moves = np.zeros((len(changed_colors), len(free_slots)))
+        for r, c in enumerate(changed_colors):
+            before = Counter(old_course_slot[m] for m in members[c] if m in old_course_slot)
+            n_before = sum(before.values())
+            moves[r] = [n_before - before.get(s, 0) for s in free_slots]
+        sub = {node: c for node, c in coloring.items() if c not in fixed}
+        morning, afternoon = preferences_per_color(sub, dataset, changed_colors, node_col, preferred_col)
+        M = moves * big + create_cost_matrix(morning, afternoon, free_slots)
+        r_idx, c_idx = linear_sum_assignment(M)
+        for r, s in zip(r_idx, c_idx):
+            color_to_slot[changed_colors[int(r)]] = free_slots[int(s)]
+
+    course_to_slot = {node: color_to_slot[c] for node, c in coloring.items()}
+    moved = [node for node, slot in course_to_slot.items()
+             if node in previous_result["course_to_slot"] and previous_result["course_to_slot"][node] != slot]
+
+    #### Ergebnis im Format von create_timetable
+    morning, afternoon = preferences_per_color(coloring, dataset, colors, node_col, preferred_col)
+    M_full = create_cost_matrix(morning, afternoon, slots)
+    slot_pos = {s: i for i, s in enumerate(slots)}
+    assignment_rows = list(range(len(colors)))
+    assignment_cols = [slot_pos[color_to_slot[c]] for c in colors]
+    pref_lookup = dict(zip(dataset[node_col], dataset[preferred_col]))
+    satisfied = sum(1 for node, slot in course_to_slot.items() if pref_lookup.get(node) == slot[2])
+    total = len(coloring)
+
+    result = {
+        "k": len(colors),
+        "weeks": W,
+        "slots": slots,
+        "colors": colors,
+        "cost_matrix": M_full,
+        "assignment_rows": assignment_rows,
+        "assignment_cols": assignment_cols,
+        "assignment_cost": float(M_full[assignment_rows, assignment_cols].sum()),
+        "color_to_slot": color_to_slot,
+        "course_to_slot": course_to_slot,
+        "satisfied": satisfied,
+        "total": total,
+        "satisfaction": satisfied / total if total else 0.0,
+    }
+
+    return {
+        "coloring": coloring,
+        "timetable": result,
+        "moved": len(moved),
+        "moved_courses": moved,
+        "recolored": len(pending) + len(shifted),
+        "changed_colors": changed_colors,
+        "added": len(diff["added"]),
+        "removed": len(diff["removed"]),
+        "changed": len(diff["changed"]),
+    }
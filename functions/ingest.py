@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+from functions.conflict_graph import ConflictGraph
+
+
+##############################################################################################
+#### CSV blockweise einlesen und Konflikt-Buckets schrittweise aufbauen
+def read_catalogue_streaming(source, node_col, constraint_cols, sep=",", chunksize=100_000,
+                             preferred_col="preferred_time", keep_cols=()):
+    """
+    Liest große CSV-Exporte in Blöcken (chunksize Zeilen), ohne den ganzen Datensatz
+    als DataFrame im Speicher zu halten. Je Constraint-Spalte wird nur ein Dictionary
+    Wert -> Bucket-Nummer geführt, die Zeilen landen als Knotennummer im Bucket.
+    Genutzt vom CLI (--stream); die App liest Uploads vollständig ein, weil Vorschau und
+    Spaltenauswahl den ganzen DataFrame brauchen.
+
+    - source: Pfad oder Datei-Objekt
+    - keep_cols: weitere Spalten (z.B. Titel für den Excel-Export), werden kategorisch gehalten
+    - Knoten-IDs sind immer Text (auch rein numerische), sonst könnte ein Block 17 und ein anderer "17" liefern
+
+    -> (schlanker DataFrame [node_col, preferred_col, keep_cols] mit kategorischen Spalten,
+        ConflictGraph, {Constraint-Spalte: Anzahl Konfliktpaare})
+    """
+    constraint_cols = list(constraint_cols)
+    header = pd.read_csv(source, sep=sep, nrows=0).columns
+    if hasattr(source, "seek"):
+        source.seek(0)
+    missing = [c for c in [node_col, *constraint_cols] if c not in header]
+    if missing:
+        raise ValueError(f"Spalten im Datensatz fehlen: {missing}")
+
+    value_cols = [c for c in [preferred_col, *keep_cols] if c in header and c != node_col]
+    usecols = list(dict.fromkeys([node_col, *constraint_cols, *value_cols]))
+
+    graph = ConflictGraph()
+    row_nodes = []
+    value_ids = {c: {} for c in constraint_cols}
+    buckets = {c: [] for c in constraint_cols}
+    categories = {c: {} for c in value_cols}
+    codes = {c: [] for c in value_cols}
+
+    #### alle Werte (auch die Knoten-IDs) als Text einlesen, damit alle Blöcke dieselben Typen liefern
+    dtypes = {c: str for c in usecols}
+    for chunk in pd.read_csv(source, sep=sep, usecols=usecols, dtype=dtypes, chunksize=chunksize):
+        node_idx = np.fromiter((graph.add_node(n) for n in chunk[node_col].tolist()),
+                               dtype=np.int64, count=len(chunk))
+        row_nodes.append(node_idx)
+
+        for c in constraint_cols:
+            local_codes, uniques = pd.factorize(chunk[c], use_na_sentinel=True)
+            uniques = uniques.tolist()
+            ids = value_ids[c]
+            col_buckets = buckets[c]
+            #### Zeilen des Blocks nach Wert gruppieren, dann je Wert an den globalen Bucket anhängen
+            order = np.flatnonzero(local_codes >= 0)
+            if len(order) == 0:
+                continue
+            order = order[np.argsort(local_codes[order], kind="stable")]
+            grouped_codes = local_codes[order]
+            grouped_nodes = node_idx[order].tolist()
+            starts = np.flatnonzero(np.diff(grouped_codes, prepend=-1)).tolist()
+            ends = starts[1:] + [len(order)]
+            for s, e in zip(starts, ends):
+                value = uniques[grouped_codes[s]]
+                b = ids.get(value)
+                if b is None:
+                    b = ids[value] = len(col_buckets)
+                    col_buckets.append([])
+                col_buckets[b].extend(grouped_nodes[s:e])
+
+        for c in value_cols:
+            local_codes, uniques = pd.factorize(chunk[c], use_na_sentinel=True)
+            cats = categories[c]
+            mapping = np.array([cats.setdefault(u, len(cats)) for u in uniques.tolist()] + [-1], dtype=np.int32)
+            codes[c].append(mapping[local_codes])
+
+    edge_counts = {}
+    for c in constraint_cols:
+        n_pairs = 0
+        for members in buckets[c]:
+            if len(members) > 1:
+                graph.add_clique_indices(members)
+                n_pairs += len(members) * (len(members) - 1) // 2
+        edge_counts[c] = n_pairs
+        buckets[c] = None
+
+    rows = np.concatenate(row_nodes) if row_nodes else np.array([], dtype=np.int64)
+    dataset = pd.DataFrame({node_col: [graph.nodes[i] for i in rows.tolist()]})
+    for c in value_cols:
+        all_codes = np.concatenate(codes[c]) if codes[c] else np.array([], dtype=np.int32)
+        dataset[c] = pd.Categorical.from_codes(all_codes, categories=list(categories[c]))
+    if preferred_col not in dataset.columns:
+        dataset[preferred_col] = None
+
+    return dataset, graph, edge_counts
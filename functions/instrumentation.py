@@ -0,0 +1,151 @@
+import contextlib
+import contextvars
+import functools
+import time
+
+#### aktiver Recorder (je Thread/Kontext, damit sich parallele App-Sitzungen nicht vermischen)
+_recorder = contextvars.ContextVar("recorder", default=None)
+_NOOP = contextlib.nullcontext()
+
+
+class _Recorder:
+    def __init__(self):
+        self.stages = {}
+        self.counters = {}
+        self.path = []
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        self.path.append(name)
+        #### beim Betreten eintragen, damit äußere Abschnitte vor den inneren stehen
+        entry = self.stages.setdefault("/".join(self.path), [0.0, 0])
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry[0] += time.perf_counter() - t0
+            entry[1] += 1
+            self.path.pop()
+
+
+##############################################################################################
+#### Messpunkte (ohne aktive Messung nur ein ContextVar-Zugriff)
+def enabled():
+    """True, wenn gerade gemessen wird (z.B. um teure Zähler nur dann zu berechnen)."""
+    return _recorder.get() is not None
+
+
+def stage(name):
+    """Kontextmanager für einen Abschnitt; verschachtelte Abschnitte erscheinen als "außen/innen"."""
+    rec = _recorder.get()
+    if rec is None:
+        return _NOOP
+    return rec.stage(name)
+
+
+def timed(name):
+    """Decorator: die ganze Funktion als Abschnitt name messen."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            rec = _recorder.get()
+            if rec is None:
+                return fn(*args, **kwargs)
+            with rec.stage(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(name, value=1):
+    """Zähler name um value erhöhen."""
+    rec = _recorder.get()
+    if rec is not None:
+        rec.counters[name] = rec.counters.get(name, 0) + value
+
+
+##############################################################################################
+#### Messung starten / auswerten
+def _profile_rows(profiler, limit):
+    import pstats
+
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, func), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        rows.append({"function": f"{func} ({filename}:{line})", "calls": ncalls, "tottime": tottime,
+                     "cumtime": cumtime})
+    rows.sort(key=lambda r: r["cumtime"], reverse=True)
+    return rows[:limit]
+
+
+@contextlib.contextmanager
+def profiling(enabled=True, cprofile=False, profile_limit=30):
+    """
+    Misst alle Abschnitte und Zähler innerhalb des with-Blocks.
+
+        with profiling(cprofile=True) as report:
+            ...
+        report["stages"], report["counters"], report["profile"]
+
+    - enabled=False: liefert None, die Messpunkte bleiben wirkungslos
+    - cprofile: zusätzlich cProfile mitschneiden (die profile_limit Funktionen mit der größten kumulierten Zeit)
+
+    Report: total (Sekunden), stages (Liste mit stage/seconds/calls in Aufrufreihenfolge),
+    counters ({Name: Wert}), profile (Liste oder None). Abschnitte in anderen Prozessen
+    (z.B. parallel gefärbte Komponenten) zählen nur als Ganzes über den aufrufenden Abschnitt.
+    """
+    if not enabled:
+        yield None
+        return
+
+    rec = _Recorder()
+    report = {}
+    token = _recorder.set(rec)
+    profiler = None
+    if cprofile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    t0 = time.perf_counter()
+    try:
+        yield report
+    finally:
+        total = time.perf_counter() - t0
+        if profiler is not None:
+            profiler.disable()
+        _recorder.reset(token)
+        report["total"] = total
+        report["stages"] = [{"stage": key, "seconds": seconds, "calls": calls}
+                            for key, (seconds, calls) in rec.stages.items()]
+        report["counters"] = dict(rec.counters)
+        report["profile"] = _profile_rows(profiler, profile_limit) if profiler is not None else None
+
+
+def merge_reports(*reports):
+    """Reports nacheinander gemessener Blöcke (z.B. Lauf und Export) zu einem zusammenführen."""
+    stages = {}
+    counters = {}
+    profile = {}
+    profile_limit = 0
+    for report in reports:
+        for row in report["stages"]:
+            entry = stages.setdefault(row["stage"], [0.0, 0])
+            entry[0] += row["seconds"]
+            entry[1] += row["calls"]
+        for name, value in report["counters"].items():
+            counters[name] = counters.get(name, 0) + value
+        if report["profile"] is not None:
+            profile_limit = max(profile_limit, len(report["profile"]))
+            for row in report["profile"]:
+                entry = profile.setdefault(row["function"], {"function": row["function"], "calls": 0,
+                                                             "tottime": 0.0, "cumtime": 0.0})
+                for key in ("calls", "tottime", "cumtime"):
+                    entry[key] += row[key]
+    rows = sorted(profile.values(), key=lambda r: r["cumtime"], reverse=True)[:profile_limit]
+    return {
+        "total": sum(report["total"] for report in reports),
+        "stages": [{"stage": key, "seconds": seconds, "calls": calls} for key, (seconds, calls) in stages.items()],
+        "counters": counters,
+        "profile": rows if any(report["profile"] is not None for report in reports) else None,
+    }
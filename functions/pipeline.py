@@ -0,0 +1,122 @@
+import hashlib
+from functools import partial
+
+from algorithms.components import branch_and_bound_by_components, color_by_components
+from algorithms.dsatur import dsatur_heap
+from algorithms.first_fit import first_fit
+from algorithms.greedy import greedy_multistart
+from algorithms.preference import preference_coloring
+from algorithms.rlf import rlf_incremental
+from algorithms.smallest_last import smallest_last_algorithm
+from algorithms.tabucol import tabucol_improve
+from functions.conflict_graph import as_conflict_graph
+from functions.create_adjacency import build_conflict_graph
+from functions.instrumentation import count, enabled, stage
+from functions.portfolio import PORTFOLIO, run_portfolio
+
+GREEDY = "Greedy-Algorithmus"
+BACKTRACKING = "Backtracking-Algorithmus"
+
+#### Färbe-Strategien (Bezeichnung in der App -> Funktion adjazenz -> {Knoten: Farbe})
+STRATEGIES = {
+    GREEDY: partial(first_fit, order="shuffled"),
+    "Welsh-Powell-Algorithmus": partial(first_fit, order="degree"),
+    BACKTRACKING: None,
+    "DSATUR-Algorithmus": dsatur_heap,
+    "RLF-Algorithmus": rlf_incremental,
+    "Smallest-Last-Algorithmus": smallest_last_algorithm,
+    PORTFOLIO: None,
+}
+
+#### Strategien mit präferenzbewusster Farbwahl (Reihenfolge für preference_coloring, None = DSATUR)
+PREFERENCE_ORDERS = {
+    GREEDY: "shuffled",
+    "Welsh-Powell-Algorithmus": "degree",
+    "DSATUR-Algorithmus": None,
+    "Smallest-Last-Algorithmus": "smallest_last",
+}
+
+
+def content_hash(data):
+    """Inhalts-Hash (z.B. der hochgeladenen CSV-Bytes) als Cache-Schlüssel."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def build_graph(dataset, node_col, constraint_cols):
+    """-> (ConflictGraph, {Constraint-Spalte: Anzahl Konfliktpaare})"""
+    node_index = dataset.columns.get_loc(node_col)
+    c_indices = [dataset.columns.get_loc(c) for c in constraint_cols]
+    return build_conflict_graph(dataset, node_index, c_indices)
+
+
+def color_graph(graph, strategy, by_components=True, processes=0, time_limit=None, seed=None, restarts=1,
+                score=None, improve_time=0, preferences=None):
+    """
+    Färbt den Graphen mit der gewählten Strategie.
+
+    - seed/restarts/score: Greedy (reproduzierbare Reihenfolge, Mehrfachstart, Gleichstand-Bewertung);
+      score bewertet auch im Portfolio Gleichstände
+    - time_limit: Zeitbudget des Backtrackings bzw. des Portfolios (Standard 30 s)
+    - improve_time: Sekunden für die anschließende Tabu-Suche (0 = aus)
+    - preferences: {Knoten: Präferenz} -> Strategien aus PREFERENCE_ORDERS wählen unter gleichwertigen
+      Farben die Klasse mit passender Präferenz (nicht beim Greedy-Mehrfachstart); der Graph wird dann
+      unabhängig von by_components in einem Durchlauf gefärbt
+
+    -> (Färbung, Details des exakten Verfahrens, des Mehrfachstarts bzw. des Portfolios oder None)
+    """
+    with stage("Färbung"):
+        coloring, details = _construct(graph, strategy, by_components, processes, time_limit, seed, restarts, score,
+                                       preferences)
+    if improve_time and improve_time > 0 and coloring:
+        with stage("Tabu-Suche"):
+            improved = tabucol_improve(graph, coloring, time_limit=improve_time, seed=seed or 0)
+        if improved["improved"]:
+            coloring = improved["coloring"]
+        details = dict(details or {}, tabu={k: v for k, v in improved.items() if k != "coloring"})
+        if strategy == BACKTRACKING and improved["improved"]:
+            details["coloring"] = coloring
+            details["k"] = improved["k"]
+            details["gap"] = improved["k"] - details["lower_bound"]
+            details["proven_optimal"] = improved["k"] <= details["lower_bound"]
+
+    if enabled():
+        conflict_graph = as_conflict_graph(graph)
+        count("Knoten", len(conflict_graph))
+        count("Kanten", conflict_graph.number_of_edges())
+        count("Farben", len(set(coloring.values())))
+        if strategy == BACKTRACKING:
+            count("Backtracking-Suchknoten", details["nodes"])
+        if details is not None and "tabu" in details:
+            count("Tabu-Iterationen", details["tabu"]["iterations"])
+    return coloring, details
+
+
+def _construct(graph, strategy, by_components, processes, time_limit, seed, restarts, score, preferences=None):
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unbekannte Strategie: {strategy}. Erlaubt: {list(STRATEGIES)}")
+
+    if strategy == PORTFOLIO:
+        race = run_portfolio(graph, time_limit=time_limit or 30.0, processes=processes, score=score, seed=seed or 0,
+                             by_components=by_components, preferences=preferences)
+        return race["coloring"], race
+
+    if strategy == GREEDY and restarts > 1:
+        multi = greedy_multistart(graph, restarts=restarts, seed=seed, processes=processes, score=score)
+        return multi["coloring"], multi
+
+    if not by_components:
+        processes = None
+    if strategy == BACKTRACKING:
+        exact = branch_and_bound_by_components(graph, time_limit=time_limit, processes=processes)
+        return exact["coloring"], exact
+
+    algorithm = STRATEGIES[strategy]
+    if preferences is not None and strategy in PREFERENCE_ORDERS:
+        #### in einem Durchlauf: getrennt gefärbte Komponenten würden über die Farbnummer Klassen mit
+        #### gegensätzlicher Präferenz zusammenlegen
+        return preference_coloring(graph, preferences, order=PREFERENCE_ORDERS[strategy], seed=seed), None
+    if strategy == GREEDY and seed is not None:
+        algorithm = partial(first_fit, order="shuffled", seed=seed)
+    if by_components:
+        return color_by_components(graph, algorithm, processes=processes), None
+    return algorithm(graph), None
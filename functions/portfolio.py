@@ -0,0 +1,131 @@
+import multiprocessing
+import os
+import queue
+import time
+
+from functions.analysis import get_graph_stats
+from functions.conflict_graph import as_conflict_graph
+
+PORTFOLIO = "Portfolio (beste Strategie im Zeitbudget)"
+
+#### Reihenfolge = Startreihenfolge, schnelle Verfahren zuerst (wichtig bei processes=1)
+PORTFOLIO_STRATEGIES = (
+    "Greedy-Algorithmus",
+    "Welsh-Powell-Algorithmus",
+    "Smallest-Last-Algorithmus",
+    "DSATUR-Algorithmus",
+    "RLF-Algorithmus",
+    "Backtracking-Algorithmus",
+)
+
+
+##############################################################################################
+#### Ein Verfahren im Worker-Prozess
+_worker_graph = None
+
+
+def _init_worker(graph):
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _run_strategy(strategy, by_components, deadline, seed, preferences, graph=None):
+    from functions.pipeline import _construct
+
+    graph = _worker_graph if graph is None else graph
+    t_start = time.perf_counter()
+    #### etwas Reserve, damit das Ergebnis vor dem Abbruch des Pools ankommt;
+    #### Worker sind Daemon-Prozesse: Komponenten hier nicht noch einmal parallel färben
+    time_limit = max(0.0, deadline - time.time()) * 0.9
+    coloring, details = _construct(graph, strategy, by_components, None, time_limit, seed, 1, None, preferences)
+    return strategy, coloring, details, time.perf_counter() - t_start
+
+
+##############################################################################################
+#### Wettlauf mehrerer Strategien
+def run_portfolio(adjazenz, time_limit=30.0, strategies=PORTFOLIO_STRATEGIES, processes=None, score=None, seed=0,
+                  by_components=True, preferences=None):
+    """
+    Startet mehrere Färbe-Strategien gleichzeitig und behält das beste Ergebnis:
+    zuerst wenigste Farben, bei Gleichstand höchster score(Färbung) (z.B. Soft-Constraint-Score aus
+    create_timetable), sonst das zuerst fertige.
+
+    Abbruch, sobald das Zeitbudget verbraucht ist oder eine Färbung nachweislich optimal ist
+    (Farbanzahl = Clique-Schranke bzw. Backtracking mit Optimalitätsbeweis). Noch laufende
+    Verfahren werden dann beendet; das Backtracking erhält die verbleibende Zeit als eigenes Budget.
+
+    - preferences: an die Strategien weitergereicht (siehe color_graph)
+    - processes: Anzahl Prozesse wie bei color_by_components (None/1 = nacheinander im aufrufenden Prozess,
+      schnelle Verfahren zuerst; 0 = alle CPU-Kerne), höchstens ein Prozess je Strategie
+
+    -> Dictionary mit bester Färbung, Gewinner-Strategie und Kurzbericht je Lauf
+    """
+    t_start = time.perf_counter()
+    deadline = time.time() + time_limit
+    graph = as_conflict_graph(adjazenz)
+    lower_bound = get_graph_stats(graph)["clique_lower_bound"]
+    strategies = list(strategies)
+    if processes == 0:
+        processes = os.cpu_count()
+
+    best = None
+    runs = []
+
+    def consider(strategy, coloring, details, elapsed):
+        nonlocal best
+        k = len(set(coloring.values()))
+        s = score(coloring) if score is not None and (best is None or k <= best["k"]) else None
+        runs.append({"strategy": strategy, "k": k, "score": s, "elapsed": elapsed})
+        if best is None or k < best["k"] or (k == best["k"] and s is not None and
+                                              (best["score"] is None or s > best["score"])):
+            best = {"coloring": coloring, "k": k, "strategy": strategy, "score": s}
+        proven = details is not None and details.get("proven_optimal", False)
+        return k <= lower_bound or (proven and k == best["k"])
+
+    optimal = False
+    if processes is None or processes <= 1 or len(strategies) <= 1:
+        for strategy in strategies:
+            if time.time() >= deadline and best is not None:
+                break
+            if consider(*_run_strategy(strategy, by_components, deadline, seed, preferences, graph)):
+                optimal = True
+                break
+    else:
+        done = queue.Queue()
+        pool = multiprocessing.Pool(min(processes, len(strategies)), initializer=_init_worker, initargs=(graph,))
+        try:
+            for strategy in strategies:
+                pool.apply_async(_run_strategy, (strategy, by_components, deadline, seed, preferences),
+                                 callback=done.put, error_callback=lambda e, s=strategy: done.put((s, e)))
+            for _ in strategies:
+                remaining = deadline - time.time()
+                try:
+                    #### ohne Ergebnis wird bis zum ersten fertigen Verfahren gewartet
+                    item = done.get(timeout=max(0.0, remaining) if best is not None else None)
+                except queue.Empty:
+                    break
+                if isinstance(item[1], BaseException):
+                    runs.append({"strategy": item[0], "error": f"{type(item[1]).__name__}: {item[1]}"})
+                    continue
+                if consider(*item):
+                    optimal = True
+                    break
+        finally:
+            pool.terminate()
+            pool.join()
+
+    if best is None:
+        raise RuntimeError("Portfolio: keine Strategie hat ein Ergebnis geliefert")
+
+    finished = {r["strategy"] for r in runs}
+    return {
+        "coloring": best["coloring"],
+        "k": best["k"],
+        "strategy": best["strategy"],
+        "score": best["score"],
+        "lower_bound": lower_bound,
+        "proven_optimal": optimal or best["k"] <= lower_bound,
+        "runs": runs,
+        "cancelled": [s for s in strategies if s not in finished],
+        "elapsed": time.perf_counter() - t_start,
+    }
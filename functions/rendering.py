@@ -0,0 +1,261 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from functions.conflict_graph import as_conflict_graph
+
+#### bis hierher nx.spring_layout wie bisher, darüber eigenes Kräfteverfahren je Komponente
+EXACT_LAYOUT_LIMIT = 400
+#### darüber wird statt des Graphen eine zusammengefasste Ansicht gezeigt
+DRAW_LIMIT = 3000
+#### Beschriftungen und gezeichnete Kanten begrenzen
+LABEL_LIMIT = 150
+EDGE_LIMIT = 20000
+
+
+##############################################################################################
+#### Hash der Graphstruktur als Cache-Schlüssel für Layouts
+def graph_hash(adj):
+    """Inhalts-Hash über Knoten und Kanten (am ConflictGraph gemerkt)."""
+    def compute(graph):
+        indptr, indices = graph.to_csr()
+        h = hashlib.sha256()
+        h.update(indptr.tobytes())
+        h.update(indices.tobytes())
+        h.update("\x00".join(map(str, graph.nodes)).encode())
+        return h.hexdigest()
+
+    return as_conflict_graph(adj).cached("hash", compute)
+
+
+##############################################################################################
+#### Layout
+def _spring_layout(graph, seed):
+    import networkx as nx
+
+    G = nx.Graph()
+    G.add_nodes_from(range(len(graph)))
+    G.add_edges_from((i, j) for i, nb in enumerate(graph.nbrs) for j in nb if i < j)
+    pos = nx.spring_layout(G, seed=seed)
+    return np.array([pos[i] for i in range(len(graph))], dtype=float)
+
+
+def _force_layout(graph, seed, iterations=60, samples=24):
+    """
+    Fruchterman-Reingold mit Stichproben-Abstoßung: je Iteration O(E + V * samples) statt O(V^2).
+    Anziehung entlang der CSR-Kanten, Abstoßung gegen zufällig gezogene Knoten (hochskaliert).
+    """
+    indptr, indices = graph.to_csr()
+    n = len(indptr) - 1
+    rng = np.random.default_rng(seed)
+    pos = rng.random((n, 2))
+    k = 1.0 / np.sqrt(n)
+    src = np.repeat(np.arange(n), np.diff(indptr))
+    dst = indices
+    t = 0.1
+    cool = t / (iterations + 1)
+
+    for _ in range(iterations):
+        others = rng.integers(0, n, size=(n, samples))
+        delta = pos[:, None, :] - pos[others]
+        dist2 = (delta ** 2).sum(axis=2) + 1e-9
+        disp = (delta * (k * k / dist2)[:, :, None]).sum(axis=1) * (n / samples)
+
+        d = pos[src] - pos[dst]
+        f = d * (np.sqrt((d ** 2).sum(axis=1)) / k)[:, None]
+        disp[:, 0] -= np.bincount(src, weights=f[:, 0], minlength=n)
+        disp[:, 1] -= np.bincount(src, weights=f[:, 1], minlength=n)
+
+        length = np.sqrt((disp ** 2).sum(axis=1)) + 1e-9
+        pos += disp * (np.minimum(length, t) / length)[:, None]
+        t -= cool
+
+    return pos
+
+
+def _normalise(pos):
+    pos = pos - pos.min(axis=0)
+    span = pos.max()
+    return pos / span if span > 0 else pos
+
+
+def compute_layout(adj, seed=42, exact_limit=EXACT_LAYOUT_LIMIT):
+    """
+    Knotenpositionen (Array V x 2, Zeile i = Knoten i des ConflictGraph).
+
+    - bis exact_limit Knoten: nx.spring_layout über den ganzen Graphen
+    - darüber: jede Zusammenhangskomponente einzeln (klein: spring_layout, groß: _force_layout),
+      danach zeilenweise nebeneinander gepackt, Fläche proportional zur Knotenzahl
+    """
+    graph = as_conflict_graph(adj)
+    n = len(graph)
+    if n == 0:
+        return np.zeros((0, 2))
+    if n <= exact_limit:
+        return _spring_layout(graph, seed)
+
+    from algorithms.components import get_components
+
+    _, components = get_components(graph)
+    components.sort(key=len, reverse=True)
+    pos = np.zeros((n, 2))
+    row_width = np.sqrt(n) * 1.2
+    x = y = row_height = 0.0
+    for comp in components:
+        size = np.sqrt(len(comp))
+        if len(comp) == 1:
+            local = np.array([[0.5, 0.5]])
+        else:
+            sub = graph.subgraph(comp)
+            local = _spring_layout(sub, seed) if len(comp) <= exact_limit else _force_layout(sub, seed)
+            local = _normalise(local)
+        if x > 0 and x + size > row_width:
+            x = 0.0
+            y += row_height * 1.1
+            row_height = 0.0
+        pos[comp] = local * size + [x, y]
+        x += size * 1.1
+        row_height = max(row_height, size)
+
+    return _normalise(pos) * 2 - 1
+
+
+##############################################################################################
+#### Vega-Lite (ohne matplotlib, im Browser gezeichnet)
+def _axis(field):
+    return {"field": field, "type": "quantitative", "axis": None, "scale": {"zero": False}}
+
+
+def graph_chart_spec(adj, pos, coloring=None, height=420, max_edges=EDGE_LIMIT, seed=0):
+    """Vega-Lite-Spezifikation: Kanten als Linien (höchstens max_edges, Stichprobe), Knoten als Punkte."""
+    graph = as_conflict_graph(adj)
+    indptr, indices = graph.to_csr()
+    src = np.repeat(np.arange(len(graph)), np.diff(indptr))
+    keep = src < indices
+    src, dst = src[keep], indices[keep]
+    if len(src) > max_edges:
+        pick = np.random.default_rng(seed).choice(len(src), size=max_edges, replace=False)
+        src, dst = src[pick], dst[pick]
+
+    edges = pd.DataFrame({"x": pos[src, 0], "y": pos[src, 1], "x2": pos[dst, 0], "y2": pos[dst, 1]})
+    nodes = pd.DataFrame({"x": pos[:, 0], "y": pos[:, 1], "Kurs": [str(v) for v in graph.nodes]})
+
+    node_encoding = {"x": _axis("x"), "y": _axis("y"), "tooltip": [{"field": "Kurs", "type": "nominal"}]}
+    if coloring:
+        nodes["Farbe"] = [coloring.get(v, -1) for v in graph.nodes]
+        node_encoding["color"] = {"field": "Farbe", "type": "nominal", "legend": None,
+                                  "scale": {"scheme": "tableau20"}}
+        node_encoding["tooltip"].append({"field": "Farbe", "type": "quantitative"})
+
+    size = float(max(8, min(200, 20000 / max(1, len(graph)))))
+    layers = [
+        {"data": {"values": edges.to_dict("records")},
+         "mark": {"type": "rule", "opacity": 0.25, "strokeWidth": 0.6},
+         "encoding": {"x": _axis("x"), "y": _axis("y"), "x2": {"field": "x2"}, "y2": {"field": "y2"}}},
+        {"data": {"values": nodes.to_dict("records")},
+         "mark": {"type": "circle", "size": size, "opacity": 0.9},
+         "encoding": node_encoding},
+    ]
+    if len(graph) <= LABEL_LIMIT:
+        layers.append({"data": {"values": nodes.to_dict("records")},
+                       "mark": {"type": "text", "fontSize": 9, "dy": -8},
+                       "encoding": {"x": _axis("x"), "y": _axis("y"), "text": {"field": "Kurs"}}})
+    return {"height": height, "layer": layers, "config": {"view": {"stroke": None}}}
+
+
+##############################################################################################
+#### matplotlib (statisches Bild wie bisher)
+def draw_matplotlib(adj, pos, coloring=None):
+    """
+    Zeichnet Kanten als eine LineCollection und Knoten als ein Scatter -> matplotlib-Figure
+    (ohne pyplot, bleibt also nicht in der globalen Figurenliste hängen).
+    """
+    from matplotlib import colormaps
+    from matplotlib.collections import LineCollection
+    from matplotlib.figure import Figure
+
+    graph = as_conflict_graph(adj)
+    n = len(graph)
+    indptr, indices = graph.to_csr()
+    src = np.repeat(np.arange(n), np.diff(indptr))
+    keep = src < indices
+
+    fig = Figure(figsize=(6.0, 5.0))
+    ax = fig.subplots()
+    segments = np.stack([pos[src[keep]], pos[indices[keep]]], axis=1)
+    ax.add_collection(LineCollection(segments, linewidths=1.0 if n <= LABEL_LIMIT else 0.3, alpha=0.6,
+                                     colors="black"))
+    node_size = max(100, 8000 / max(1, n)) if n <= LABEL_LIMIT else max(2, 20000 / max(1, n))
+    if coloring:
+        colors = [coloring.get(v, -1) for v in graph.nodes]
+        ax.scatter(pos[:, 0], pos[:, 1], s=node_size, c=colors, cmap=colormaps["tab20"], zorder=2)
+    else:
+        ax.scatter(pos[:, 0], pos[:, 1], s=node_size, c="#1f78b4", zorder=2)
+    if n <= LABEL_LIMIT:
+        font_size = max(4, 14 - n / 10)
+        for (x, y), v in zip(pos, graph.nodes):
+            ax.text(x, y, str(v), fontsize=font_size, ha="center", va="center", zorder=3)
+    ax.autoscale()
+    ax.axis("off")
+    return fig
+
+
+##############################################################################################
+#### Zusammengefasste Ansicht für sehr große Graphen
+def color_class_graph(adj, coloring):
+    """
+    Quotientengraph der Färbung: ein Knoten je Farbklasse, Kante = Konflikte zwischen zwei Klassen.
+    -> (DataFrame Farbe/Kurse, DataFrame a/b/Konflikte)
+    """
+    graph = as_conflict_graph(adj)
+    color_of = np.array([coloring.get(v, -1) for v in graph.nodes], dtype=np.int64)
+    colors, counts = np.unique(color_of, return_counts=True)
+    classes = pd.DataFrame({"Farbe": colors, "Kurse": counts})
+
+    indptr, indices = graph.to_csr()
+    src = np.repeat(np.arange(len(graph)), np.diff(indptr))
+    a, b = color_of[src], color_of[indices]
+    keep = a < b
+    pairs = pd.DataFrame({"a": a[keep], "b": b[keep]})
+    edges = pairs.groupby(["a", "b"]).size().rename("Konflikte").reset_index()
+    return classes, edges
+
+
+def component_summary(adj):
+    """Verteilung der Komponentengrößen -> DataFrame Größe/Anzahl (größte zuerst)."""
+    from algorithms.components import get_components
+
+    _, components = get_components(adj)
+    sizes = pd.Series([len(c) for c in components], dtype=np.int64)
+    summary = sizes.value_counts().rename_axis("Größe").rename("Anzahl").reset_index()
+    return summary.sort_values("Größe", ascending=False, ignore_index=True)
+
+
+def class_chart_spec(classes, edges, height=420):
+    """Vega-Lite-Spezifikation des Quotientengraphen: Klassen auf einem Kreis, Größe = Anzahl Kurse."""
+    angle = 2 * np.pi * np.arange(len(classes)) / max(1, len(classes))
+    xy = {c: (np.cos(t), np.sin(t)) for c, t in zip(classes["Farbe"].tolist(), angle)}
+    nodes = classes.assign(x=[xy[c][0] for c in classes["Farbe"]], y=[xy[c][1] for c in classes["Farbe"]])
+    lines = edges.assign(x=[xy[a][0] for a in edges["a"]], y=[xy[a][1] for a in edges["a"]],
+                         x2=[xy[b][0] for b in edges["b"]], y2=[xy[b][1] for b in edges["b"]])
+    return {
+        "height": height,
+        "layer": [
+            {"data": {"values": lines.to_dict("records")},
+             "mark": {"type": "rule", "opacity": 0.3},
+             "encoding": {"x": _axis("x"), "y": _axis("y"), "x2": {"field": "x2"}, "y2": {"field": "y2"},
+                          "strokeWidth": {"field": "Konflikte", "type": "quantitative", "legend": None,
+                                          "scale": {"range": [0.3, 4]}}}},
+            {"data": {"values": nodes.to_dict("records")},
+             "mark": {"type": "circle", "opacity": 0.9},
+             "encoding": {"x": _axis("x"), "y": _axis("y"),
+                          "size": {"field": "Kurse", "type": "quantitative", "legend": None,
+                                   "scale": {"range": [30, 1500]}},
+                          "color": {"field": "Farbe", "type": "nominal", "legend": None,
+                                    "scale": {"scheme": "tableau20"}},
+                          "tooltip": [{"field": "Farbe", "type": "quantitative"},
+                                      {"field": "Kurse", "type": "quantitative"}]}},
+        ],
+        "config": {"view": {"stroke": None}},
+    }
@@ -1,9 +1,198 @@
 import numpy as np
-#from scipy.optimize import linear_sum_assignment
+import pandas as pd
+from functions.assignment import linear_sum_assignment
+from functions.conflict_graph import as_conflict_graph
+from functions.instrumentation import stage, timed
 from math import ceil
 from math import inf
 
-def create_timetable(dataset, adjazenz, coloring_dict):
+#### Standard-Slotmodell: Mo-Fr x Vormittag/Nachmittag, eine Farbklasse je Slot
+DAYS = ["Mo", "Di", "Mi", "Do", "Fr"]
+HALVES = ["Morning", "Afternoon"]
+
+
+##############################################################################################
+#### Wochenbedarf bestimmen
+def get_weeks(k, slots_per_week=10):
+    W = ceil(k / slots_per_week)
+    return W
+
+
+##############################################################################################
+#### Präferenzverteilung je Farbe berechnen (ein Join + bincount statt Suche je Kurs)
+def preferences_per_color(coloring_dict, dataset, colors, node_col="course_id", preferred_col="preferred_time"):
+    #### Kurs -> Präferenz (bei Mehrfachzeilen zählt die erste Zeile)
+    preferred = dataset.drop_duplicates(subset=node_col).set_index(node_col)[preferred_col]
+    coloring = pd.Series(coloring_dict)
+    pref = preferred.reindex(coloring.index).to_numpy()
+
+    #### Farbe -> Zeilenindex der Kostenmatrix
+    color_idx = np.searchsorted(colors, coloring.to_numpy())
+    morning = np.bincount(color_idx[pref == "Morning"], minlength=len(colors))
+    afternoon = np.bincount(color_idx[pref == "Afternoon"], minlength=len(colors))
+    return morning, afternoon
+
+
+##############################################################################################
+#### Zeitslots erstellen
+def making_time_slots(W, days=DAYS, halves=HALVES):
+    slots = [(w, d, h) for w in range(1, W + 1) for d in days for h in halves]
+    return slots
+
+
+##############################################################################################
+#### Kostenmatrix erstellen: Morning-Slot kostet die Afternoon-Präferenzen und umgekehrt
+def create_cost_matrix(morning, afternoon, slots):
+    is_morning = np.array([slot[2] in ("Morning", "m") for slot in slots], dtype=bool)
+    M = np.where(is_morning[None, :], afternoon[:, None], morning[:, None])
+    return M.astype(float)
+
+
+##############################################################################################
+#### Slotmodell mit Kapazität: konfliktfreie kleine Farbklassen teilen sich einen Slot
+def pack_color_classes(adjazenz, coloring_dict, capacity, preferred=None):
+    """
+    Verteilt die Kurse auf möglichst wenige Slot-Gruppen mit höchstens capacity Kursen
+    (z.B. Anzahl verfügbarer Räume, inf = unbegrenzt).
+
+    - Farbklassen größer als capacity werden geteilt (Teilmengen bleiben konfliktfrei),
+      nach Präferenz sortiert, damit die Teile möglichst einheitliche Präferenzen haben
+    - ein Teil darf zu einer Gruppe mit freier Kapazität, wenn keiner seiner Kurse mit einem
+      Kurs der Gruppe in Konflikt steht (First-Fit-Decreasing)
+
+    -> Liste der Gruppen (je Gruppe eine Liste von Kursen)
+    """
+    if capacity < 1:
+        raise ValueError("capacity muss mindestens 1 sein")
+    graph = as_conflict_graph(adjazenz)
+    index = graph.index
+    nbrs = graph.nbrs
+
+    classes = {}
+    for node, c in coloring_dict.items():
+        classes.setdefault(c, []).append(node)
+
+    pieces = []
+    for c in sorted(classes):
+        members = classes[c]
+        if preferred is not None:
+            members = sorted(members, key=lambda m: str(preferred.get(m)))
+        step = len(members) if capacity == inf else int(capacity)
+        for s in range(0, len(members), step):
+            pieces.append(members[s:s + step])
+    pieces.sort(key=len, reverse=True)
+
+    groups = []
+    # Gruppen mit freier Kapazität: [Index in groups, Nachbarn aller Kurse der Gruppe]
+    open_groups = []
+    for members in pieces:
+        idx = [index[m] for m in members]
+        target = None
+        for entry in open_groups:
+            g = groups[entry[0]]
+            if len(g) + len(members) <= capacity and not any(i in entry[1] for i in idx):
+                target = entry
+                break
+        if target is None:
+            target = [len(groups), set()]
+            groups.append([])
+            open_groups.append(target)
+        groups[target[0]].extend(members)
+        for i in idx:
+            target[1].update(nbrs[i])
+        if len(groups[target[0]]) >= capacity:
+            open_groups.remove(target)
+
+    return groups
+
+
+def create_period_cost_matrix(groups, preferred, slots, halves):
+    """Kosten = Kurse der Gruppe mit einer anderen bevorzugten Periode als der des Slots."""
+    period_idx = {h: i for i, h in enumerate(halves)}
+    counts = np.zeros((len(groups), len(halves)))
+    for r, members in enumerate(groups):
+        for m in members:
+            p = period_idx.get(preferred.get(m))
+            if p is not None:
+                counts[r, p] += 1
+    slot_period = np.array([period_idx[s[2]] for s in slots], dtype=np.int64)
+    return counts.sum(axis=1)[:, None] - counts[:, slot_period]
+
+
+def _create_timetable_packed(dataset, adjazenz, coloring_dict, days, halves, capacity, node_col, preferred_col):
+    preferred = dataset.drop_duplicates(subset=node_col).set_index(node_col)[preferred_col].to_dict()
+    colors = sorted(set(coloring_dict.values()))
+
+    if capacity is None:
+        members = {c: [] for c in colors}
+        for node, c in coloring_dict.items():
+            members[c].append(node)
+        groups = [members[c] for c in colors]
+    else:
+        with stage("Packen"):
+            groups = pack_color_classes(adjazenz, coloring_dict, capacity, preferred)
+
+    #### zuerst Wochen minimieren (so wenige Gruppen wie möglich), dann Präferenzkosten
+    W = get_weeks(len(groups), len(days) * len(halves))
+    slots = making_time_slots(W, days, halves)
+    with stage("Kostenmatrix"):
+        M = create_period_cost_matrix(groups, preferred, slots, halves)
+    with stage("Zuordnung"):
+        rows, cols = linear_sum_assignment(M)
+
+    course_to_slot = {}
+    color_to_slots = {c: [] for c in colors}
+    #### in Slot-Reihenfolge, damit die Slots je Farbe chronologisch sind
+    for s, r in sorted(zip(cols.tolist(), rows.tolist())):
+        for node in groups[r]:
+            course_to_slot[node] = slots[s]
+            slots_of_color = color_to_slots[coloring_dict[node]]
+            if slots[s] not in slots_of_color:
+                slots_of_color.append(slots[s])
+    #### geteilte Farbklassen haben keinen eindeutigen Slot
+    color_to_slot = {c: s[0] for c, s in color_to_slots.items() if len(s) == 1}
+
+    satisfied = sum(1 for node, slot in course_to_slot.items() if preferred.get(node) == slot[2])
+    total = len(coloring_dict)
+
+    return {
+        "k": len(colors),
+        "weeks": W,
+        "slots": slots,
+        "colors": colors,
+        "groups": groups,
+        "cost_matrix": M,
+        "assignment_rows": rows.tolist(),
+        "assignment_cols": cols.tolist(),
+        "assignment_cost": float(M[rows, cols].sum()),
+        "color_to_slot": color_to_slot,
+        "color_to_slots": color_to_slots,
+        "course_to_slot": course_to_slot,
+        "satisfied": satisfied,
+        "total": total,
+        "satisfaction": satisfied / total if total else 0.0,
+    }
+
+
+@timed("Stundenplan")
+def create_timetable(dataset, adjazenz, coloring_dict, days=None, halves=None, capacity=None, node_col="course_id",
+                     preferred_col="preferred_time"):
+    """
+    Ordnet die Farbklassen Zeitslots zu (Woche, Tag, Periode).
+
+    Ohne Parameter: Mo-Fr x Morning/Afternoon, jede Farbklasse bekommt einen eigenen Slot.
+    - days / halves: eigenes Slotmodell (z.B. ["Mo", ..., "Sa"], ["1. Block", "2. Block", "3. Block"])
+    - capacity: höchstens so viele Kurse je Slot (z.B. verfügbare Räume, inf = unbegrenzt);
+      konfliktfreie kleine Farbklassen teilen sich dann Slots, große werden geteilt.
+      Zeilen von cost_matrix/assignment_rows beziehen sich dann auf result["groups"].
+      Eine geteilte Farbklasse liegt in mehreren Slots: result["color_to_slots"] ({Farbe: [Slots]}) ist
+      vollständig, color_to_slot enthält nur die ungeteilten Klassen; je Kurs gilt course_to_slot.
+    - node_col / preferred_col: Spalten mit Kurs-ID und bevorzugter Periode
+    """
+    if days is not None or halves is not None or capacity is not None:
+        return _create_timetable_packed(dataset, adjazenz, coloring_dict, days or DAYS, halves or HALVES,
+                                        capacity, node_col, preferred_col)
+
     ##############################################################################################
     #### Bevorzugte Zeiten als Dictionary
     def get_preferred_time(dataset):
@@ -23,179 +212,13 @@ def create_timetable(dataset, adjazenz, coloring_dict):
         return k
 
     ##############################################################################################
-    #### Wochenbedarf bestimmen
-    def get_weeks(k):
-        W = ceil(k / 10)
-        return W
-
-    ##############################################################################################
-    #### Farbklassen bilden
-    def get_color_classes(coloring_dict):
-        color_set = set(coloring_dict.values())
-        color_classes = {}
-        for i in color_set:
-            for n in coloring_dict:
-                if coloring_dict[n] == i:
-                    if i in color_classes:
-                        color_classes[i].append(n)
-                    else:
-                        color_classes[i] = []
-                        color_classes[i].append(n)
-        return color_classes
-
-    ##############################################################################################
-    #### Präferenzverteilung je Farbe berechnen
-    def preferences_per_color(color_classes, dataset):
-        #### neues verschachteltes dictionary erstellen
-        preferences_per_color = {}
-        #### Für jede Farbklasse die Anzahl der Präferenzen berechnen und in preferences_per_color einfügen
-        for l in color_classes:
-            morning_count = 0
-            afternoon_count = 0
-            for n in color_classes[l]:
-                index = dataset.index[dataset["course_id"] == n][0]
-                if dataset.loc[index, "preferred_time"] == "Morning":
-                    morning_count = morning_count + 1
-                elif dataset.loc[index, "preferred_time"] == "Afternoon":
-                    afternoon_count = afternoon_count + 1
-            preferences_per_color[l] = {"m": morning_count, "a": afternoon_count}
-        return preferences_per_color
-
-    ##############################################################################################
-    #### Zeitslots erstellen
-    def making_time_slots(W):
-        days = ["Mo", "Di", "Mi", "Do", "Fr"]
-        halves = ["Morning", "Afternoon"]
-        slots = [(w, d, h) for w in range(1, W + 1) for d in days for h in halves]
-        return slots
-
-    ##############################################################################################
-    #### Kostenmatrix erstellen
-    def create_cost_matrix(preferences_per_color, slots, colors):
-        k = len(colors)
-        M = np.zeros((k, len(slots)))
-
-        for row_idx, color in enumerate(colors):
-            pref = preferences_per_color[color]
-            for col_idx, slot in enumerate(slots):
-                half = slot[2]
-                if half in ("Morning", "m"):
-                    M[row_idx, col_idx] = pref["a"]
-                else:
-                    M[row_idx, col_idx] = pref["m"]
-        return M
-
-    ##############################################################################################
-    #### Hungarian-Algorithmus
-    def linear_sum_assignment(cost_matrix):
-        """
-        Rein-Python-Version des Hungarian-Algorithmus.
-        Kompatible Rückgabe zu scipy.optimize.linear_sum_assignment:
-        -> (row_ind, col_ind) als Listen von Indizes.
-
-        - cost_matrix: 2D list/ndarray (>=0 empfohlen), rechteckig erlaubt.
-        """
-        # -- in ndarray konvertieren
-        C = np.asarray(cost_matrix, dtype=float)
-        if C.size == 0:
-            return [], []
-
-        n_rows, n_cols = C.shape
-        n = max(n_rows, n_cols)
-
-        # -- auf quadratisch auffüllen (Padding mit 0)
-        if n_rows != n_cols:
-            P = np.zeros((n, n), dtype=float)
-            P[:n_rows, :n_cols] = C
-            C = P
-
-        # -- Zeilen- und Spaltenreduktion
-        C -= C.min(axis=1, keepdims=True)
-        C -= C.min(axis=0, keepdims=True)
-
-        n = C.shape[0]
-        # match_col[c] = r  (wenn Spalte c der Zeile r zugeordnet ist), sonst -1
-        match_col = np.full(n, -1, dtype=int)
-
-        def try_augment(r, seen_cols, zero_mask):
-            """DFS: augmentierender Pfad im Nullgraphen."""
-            for c in range(n):
-                if zero_mask[r, c] and not seen_cols[c]:
-                    seen_cols[c] = True
-                    if match_col[c] == -1 or try_augment(match_col[c], seen_cols, zero_mask):
-                        match_col[c] = r
-                        return True
-            return False
-
-        while True:
-            zero_mask = (C == 0.0)
-
-            # Maximum Matching im Nullgraphen
-            match_col[:] = -1
-            for r in range(n):
-                seen = np.zeros(n, dtype=bool)
-                try_augment(r, seen, zero_mask)
-
-            if np.all(match_col != -1):
-                # Vollständiges Matching -> fertig
-                break
-
-            # Minimum Vertex Cover konstruieren (Kőnig):
-            # Starred zeros = aktuelles Matching
-            # Markierte Reihen = freie Reihen (nicht gematcht)
-            matched_rows = np.full(n, False)
-            for c, r in enumerate(match_col):
-                if r != -1:
-                    matched_rows[r] = True
-            rows_marked = ~matched_rows
-            cols_marked = np.zeros(n, dtype=bool)
-
-            # BFS/Wechselwege entlang Nullkanten
-            changed = True
-            while changed:
-                changed = False
-                # (1) markierte Zeilen -> markiere Spalten mit Nullen
-                for r in np.where(rows_marked)[0]:
-                    for c in np.where(zero_mask[r])[0]:
-                        if not cols_marked[c]:
-                            cols_marked[c] = True
-                            changed = True
-                            # (2) markierte Spalten -> markiere die Zeile des "starred" Nulls (Match)
-                            if match_col[c] != -1 and not rows_marked[match_col[c]]:
-                                rows_marked[match_col[c]] = True
-                                changed = True
-
-            # Minimale Überdeckung: (UNmarkierte Reihen) U (markierte Spalten)
-            # Uncovered Elemente: markierte Reihen & UNmarkierte Spalten
-            uncovered_rows = rows_marked
-            uncovered_cols = ~cols_marked
-
-            # Wenn alles überdeckt wäre (kann numerisch vorkommen) -> Ende
-            if not uncovered_rows.any() or not uncovered_cols.any():
-                # kleine numerische Korrektur:
-                C += 0.0  # no-op
-            else:
-                m = np.min(C[np.ix_(uncovered_rows, uncovered_cols)])
-                # Matrix anpassen
-                C[uncovered_rows, :] -= m
-                C[:, cols_marked] += m
-            # Danach neue Nullen entstanden -> nächste Matching-Runde
-
-        # Zuordnung extrahieren und auf Originalgröße zurückfiltern
-        rows, cols = [], []
-        for c, r in enumerate(match_col):
-            if r != -1 and r < n_rows and c < n_cols:
-                rows.append(int(r))
-                cols.append(int(c))
-        return rows, cols
-    ##############################################################################################
     #### Kostenmatrix minimieren.
     def min_cost_matrix(M):
         M = np.asarray(M)
         rows, cols = linear_sum_assignment(M)
         total_cost = M[rows, cols].sum()
 
-        return rows, cols, float(total_cost)
+        return rows.tolist(), cols.tolist(), float(total_cost)
 
     ##############################################################################################
     #### Farben den slots zuweisen und Kosten des Algorithmus berechnen
@@ -213,7 +236,7 @@ def create_timetable(dataset, adjazenz, coloring_dict):
             course_to_slot[course_id] = color_to_slot[color]
 
         #### Präferenz-Lookup
-        preferred = dict(zip(dataset["course_id"], dataset["preferred_time"]))
+        preferred = dict(zip(dataset[node_col], dataset[preferred_col]))
 
         #### Präferenzen zählen
         def half_matches(half, pref):
@@ -239,13 +262,12 @@ def create_timetable(dataset, adjazenz, coloring_dict):
     W = get_weeks(k)
     slots = making_time_slots(W)
 
-    color_classes = get_color_classes(coloring_dict)
-    pref_per_color = preferences_per_color(color_classes, dataset)
-
     colors = sorted(set(coloring_dict.values()))
-
-    M = create_cost_matrix(pref_per_color, slots, colors)
-    rows, cols, total_costs = min_cost_matrix(M)
+    with stage("Kostenmatrix"):
+        morning, afternoon = preferences_per_color(coloring_dict, dataset, colors, node_col, preferred_col)
+        M = create_cost_matrix(morning, afternoon, slots)
+    with stage("Zuordnung"):
+        rows, cols, total_costs = min_cost_matrix(M)
 
     color_to_slot, course_to_slot, score, satisfied, total, assignment_cost = \
         map_colors_and_calculate_costs(rows, cols, total_costs, adjazenz, coloring_dict, dataset, slots, colors)
@@ -0,0 +1,76 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from functions.assignment import linear_sum_assignment
+
+
+def _brute_force(C, maximize):
+    """Optimale Gesamtkosten über alle Zuordnungen der kleineren Seite (None = keine zulässige)."""
+    rows, cols = C.shape
+    best = None
+    if rows <= cols:
+        candidates = ((range(rows), p) for p in itertools.permutations(range(cols), rows))
+    else:
+        candidates = ((p, range(cols)) for p in itertools.permutations(range(rows), cols))
+    for r, c in candidates:
+        total = C[list(r), list(c)].sum()
+        if not np.isfinite(total):
+            continue
+        if best is None or (total > best if maximize else total < best):
+            best = total
+    return best
+
+
+def _matrices():
+    rng = np.random.default_rng(7)
+    for shape in [(1, 1), (3, 3), (5, 5), (6, 6), (2, 5), (3, 6), (5, 2), (6, 4)]:
+        for _ in range(8):
+            yield rng.integers(0, 20, size=shape).astype(float)
+            yield rng.random(shape)
+
+
+SHAPES = list(_matrices())
+
+
+@pytest.mark.parametrize("maximize", [False, True])
+def test_matches_brute_force(maximize):
+    for C in SHAPES:
+        rows, cols = linear_sum_assignment(C, maximize=maximize)
+        assert len(rows) == min(C.shape)
+        assert list(rows) == sorted(rows)
+        assert len(set(cols)) == len(cols)
+        assert C[rows, cols].sum() == pytest.approx(_brute_force(C, maximize))
+
+
+def test_forbidden_pairs():
+    rng = np.random.default_rng(11)
+    checked = 0
+    for C in SHAPES:
+        C = C.copy()
+        C[rng.random(C.shape) < 0.3] = np.inf
+        best = _brute_force(C, maximize=False)
+        if best is None:
+            with pytest.raises(ValueError):
+                linear_sum_assignment(C)
+            continue
+        rows, cols = linear_sum_assignment(C)
+        assert np.isfinite(C[rows, cols]).all()
+        assert C[rows, cols].sum() == pytest.approx(best)
+        checked += 1
+    assert checked > len(SHAPES) // 2
+
+
+def test_invalid_input():
+    with pytest.raises(ValueError):
+        linear_sum_assignment(np.zeros(3))
+    with pytest.raises(ValueError):
+        linear_sum_assignment(np.array([[1.0, np.nan]]))
+    with pytest.raises(ValueError):
+        linear_sum_assignment(np.array([[1.0, np.inf]]), maximize=True)
+
+
+def test_empty():
+    rows, cols = linear_sum_assignment(np.zeros((0, 3)))
+    assert len(rows) == len(cols) == 0
@@ -0,0 +1,80 @@
+import itertools
+import random
+
+import pytest
+
+from algorithms.backtracking import branch_and_bound_coloring
+
+
+def _random_graph(n, p, seed):
+    rng = random.Random(seed)
+    adj = {v: [] for v in range(n)}
+    for u, v in itertools.combinations(range(n), 2):
+        if rng.random() < p:
+            adj[u].append(v)
+            adj[v].append(u)
+    return adj
+
+
+def _odd_cycle(n):
+    return {i: [(i - 1) % n, (i + 1) % n] for i in range(n)}
+
+
+def _brute_force_chromatic(adj):
+    """Kleinstes k mit einer gültigen Färbung, durch Ausprobieren aller Färbungen (Knoten 0 fest auf Farbe 0)."""
+    nodes = list(adj)
+    if not nodes:
+        return 0
+    edges = [(u, v) for u in adj for v in adj[u] if u < v]
+    pos = {v: i for i, v in enumerate(nodes)}
+    for k in range(1, len(nodes) + 1):
+        for rest in itertools.product(range(k), repeat=len(nodes) - 1):
+            colors = (0,) + rest
+            if all(colors[pos[u]] != colors[pos[v]] for u, v in edges):
+                return k
+    return len(nodes)
+
+
+def _assert_proper(adj, coloring):
+    assert set(coloring) == set(adj)
+    for v, nbs in adj.items():
+        for u in nbs:
+            assert coloring[u] != coloring[v]
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_matches_brute_force(seed):
+    rng = random.Random(seed)
+    adj = _random_graph(rng.randint(1, 7), rng.choice([0.2, 0.4, 0.6, 0.8]), seed)
+    result = branch_and_bound_coloring(adj)
+    _assert_proper(adj, result["coloring"])
+    assert result["k"] == len(set(result["coloring"].values())) == _brute_force_chromatic(adj)
+    assert result["proven_optimal"]
+    assert result["lower_bound"] == result["k"]
+    assert result["gap"] == 0
+
+
+def test_proof_beyond_clique_bound():
+    #### ungerader Kreis: Clique 2, chromatische Zahl 3
+    adj = _odd_cycle(2001)
+    result = branch_and_bound_coloring(adj)
+    _assert_proper(adj, result["coloring"])
+    assert (result["k"], result["lower_bound"], result["proven_optimal"], result["gap"]) == (3, 3, True, 0)
+
+
+@pytest.mark.parametrize("budget", [{"node_limit": 1}, {"time_limit": 0}])
+def test_budget_stop(budget):
+    adj = _odd_cycle(7)
+    result = branch_and_bound_coloring(adj, **budget)
+    _assert_proper(adj, result["coloring"])
+    assert result["proven_optimal"] is False
+    assert result["k"] == 3
+    assert result["lower_bound"] == 2
+    assert result["gap"] == 1
+    assert result["nodes"] <= 1
+
+
+def test_empty_graph():
+    result = branch_and_bound_coloring({})
+    assert result["coloring"] == {}
+    assert result["k"] == 0 and result["proven_optimal"]
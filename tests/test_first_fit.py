@@ -0,0 +1,46 @@
+import os
+
+import pandas as pd
+import pytest
+
+from algorithms import first_fit as ff
+from algorithms.greedy import greedy_algorithm
+from algorithms.welsh_powell import welsh_powell_algorithm
+from benchmarks.synthetic import BUNDLED_DATASETS, CONSTRAINT_COLUMNS, generate_catalogue
+from functions.pipeline import build_graph
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DATASETS = [pytest.param(path, id=name) for name, path in BUNDLED_DATASETS.items()]
+DATASETS += [pytest.param((n, seed), id=f"synthetic-{n}-{seed}") for n, seed in [(300, 0), (2000, 1)]]
+
+
+def _graph(source):
+    df = pd.read_csv(os.path.join(ROOT, source)) if isinstance(source, str) else generate_catalogue(*source)
+    graph, _ = build_graph(df, "course_id", CONSTRAINT_COLUMNS)
+    return graph
+
+
+@pytest.fixture(params=["lists", "numpy"])
+def path(request, monkeypatch):
+    """Erzwingt den Listen- bzw. numpy/CSR-Pfad von first_fit_colors und prüft, dass er benutzt wurde."""
+    used = []
+    for name in ("_first_fit_lists", "_first_fit_numpy"):
+        original = getattr(ff, name)
+        monkeypatch.setattr(ff, name, lambda *a, _fn=original, _name=name: used.append(_name) or _fn(*a))
+    monkeypatch.setattr(ff, "VECTOR_DEGREE", 0 if request.param == "numpy" else 10 ** 9)
+    yield request.param
+    assert used and set(used) == {f"_first_fit_{request.param}"}
+
+
+@pytest.mark.parametrize("seed", [0, 1, 42])
+@pytest.mark.parametrize("source", DATASETS)
+def test_shuffled_matches_greedy_algorithm(source, seed, path):
+    graph = _graph(source)
+    assert ff.first_fit(graph, order="shuffled", seed=seed) == greedy_algorithm(graph, seed=seed)
+
+
+@pytest.mark.parametrize("source", DATASETS)
+def test_degree_matches_welsh_powell(source, path):
+    graph = _graph(source)
+    assert ff.first_fit(graph, order="degree") == welsh_powell_algorithm(graph)
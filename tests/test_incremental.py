@@ -0,0 +1,68 @@
+import os
+
+import pandas as pd
+import pytest
+
+from algorithms.dsatur import dsatur_heap
+from benchmarks.synthetic import CONSTRAINT_COLUMNS
+from functions.incremental import diff_datasets, recolor_incremental
+from functions.pipeline import build_graph
+from functions.timetable_algo import create_timetable
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _edges(graph):
+    return {node: set(graph[node]) for node in graph}
+
+
+def _edit(df):
+    """Ändert, entfernt und ergänzt Kurse (inkl. Konflikten zu bestehenden Kursen)."""
+    new = df.copy()
+    new.loc[0, "room"] = new.loc[5, "room"]
+    new.loc[1, "lecturer"] = new.loc[7, "lecturer"]
+    new.loc[2, "preferred_time"] = "Afternoon" if new.loc[2, "preferred_time"] == "Morning" else "Morning"
+    new = new.drop(index=[3, 4])
+    added = df.iloc[[10, 11]].copy()
+    added["course_id"] = ["NEU1", "NEU2"]
+    return pd.concat([new, added], ignore_index=True)
+
+
+@pytest.fixture
+def catalogue():
+    df = pd.read_csv(os.path.join(ROOT, "courses_medium_simple.csv"))
+    graph, _ = build_graph(df, "course_id", CONSTRAINT_COLUMNS)
+    coloring = dsatur_heap(graph)
+    return df, graph, coloring, create_timetable(df, graph, coloring)
+
+
+def test_recolor_incremental_matches_rebuild(catalogue):
+    df, graph, coloring, result = catalogue
+    new = _edit(df)
+    diff = diff_datasets(df, new)
+    assert diff["added"] == ["NEU1", "NEU2"]
+    assert len(diff["removed"]) == 2 and len(diff["changed"]) == 3
+
+    inc = recolor_incremental(graph, new, diff, coloring, result, constraint_cols=CONSTRAINT_COLUMNS)
+
+    expected, _ = build_graph(new, "course_id", CONSTRAINT_COLUMNS)
+    assert _edges(graph) == _edges(expected)
+
+    new_coloring = inc["coloring"]
+    assert set(new_coloring) == set(new["course_id"])
+    for node, nbs in expected.items():
+        for u in nbs:
+            assert new_coloring[u] != new_coloring[node]
+
+    timetable = inc["timetable"]
+    assert set(timetable["course_to_slot"]) == set(new_coloring)
+    for node, c in new_coloring.items():
+        assert timetable["course_to_slot"][node] == timetable["color_to_slot"][c]
+
+
+def test_recolor_incremental_rejects_packed_result(catalogue):
+    df, graph, coloring, _ = catalogue
+    packed = create_timetable(df, graph, coloring, capacity=5)
+    new = _edit(df)
+    with pytest.raises(ValueError):
+        recolor_incremental(graph, new, diff_datasets(df, new), coloring, packed, constraint_cols=CONSTRAINT_COLUMNS)
@@ -0,0 +1,41 @@
+import os
+
+import pandas as pd
+import pytest
+
+from algorithms.rlf import rlf_algorithm, rlf_incremental
+from benchmarks.synthetic import BUNDLED_DATASETS, CONSTRAINT_COLUMNS, generate_catalogue
+from functions.create_adjacency import build_conflict_graph
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DATASETS = [pytest.param(path, id=name) for name, path in BUNDLED_DATASETS.items()]
+DATASETS += [pytest.param((n, seed), id=f"synthetic-{n}-{seed}") for n, seed in [(200, 0), (500, 1), (1000, 2)]]
+
+
+def _graph(source):
+    df = pd.read_csv(os.path.join(ROOT, source)) if isinstance(source, str) else generate_catalogue(*source)
+    graph, _ = build_conflict_graph(df, df.columns.get_loc("course_id"),
+                                    [df.columns.get_loc(c) for c in CONSTRAINT_COLUMNS])
+    return graph
+
+
+def _assert_proper(graph, coloring):
+    assert set(coloring) == set(graph.nodes)
+    for v, nbs in graph.items():
+        for u in nbs:
+            assert coloring[u] != coloring[v], f"{u} und {v} haben dieselbe Farbe"
+
+
+@pytest.mark.parametrize("bitset", [False, True], ids=["sets", "bitset"])
+@pytest.mark.parametrize("source", DATASETS)
+def test_rlf_incremental_matches_rlf_algorithm(source, bitset):
+    graph = _graph(source)
+    expected = rlf_algorithm(graph)
+    actual = rlf_incremental(graph, bitset=bitset)
+    assert actual == expected
+    _assert_proper(graph, actual)
+
+
+def test_rlf_incremental_empty_graph():
+    assert rlf_incremental({}) == {} == rlf_algorithm({})